@@ -1,6 +1,8 @@
 from collections import OrderedDict
+import hashlib
 import json
 import os
+import re
 
 from opentrons.containers.persisted_containers import get_persisted_container
 from opentrons.containers import persisted_containers
@@ -13,7 +15,9 @@ from opentrons.containers.placeable import (
     unpack_location
 )
 from opentrons.containers.calibrator import apply_calibration
+from opentrons.containers.well_index import WellIndex
 from opentrons.util import environment
+from opentrons.util.files import atomic_write
 
 __all__ = [
     get_persisted_container,
@@ -23,7 +27,8 @@ __all__ = [
     Well,
     WellSeries,
     unpack_location,
-    apply_calibration]
+    apply_calibration,
+    WellIndex]
 
 
 def load(robot, container_name, slot, label=None):
@@ -66,7 +71,7 @@ def create(name, grid, spacing, diameter, depth, volume=0):
             custom_container.add(well, well_name, coordinates)
     json_container = container_to_json(custom_container, name)
     save_custom_container(json_container)
-    persisted_containers.load_all_persisted_containers_from_disk()
+    persisted_containers.reload_persisted_containers_from_disk()
 
 
 def container_to_json(c, name):
@@ -86,13 +91,36 @@ def container_to_json(c, name):
 
 
 def save_custom_container(data):
-    container_file_path = environment.get_path('CONTAINERS_FILE')
-    if not os.path.isfile(container_file_path):
-        with open(container_file_path, 'w') as f:
-            f.write(json.dumps({'containers': {}}))
-    with open(container_file_path, 'r+') as f:
-        old_data = json.load(f)
-        old_data['containers'].update(data)
-        f.seek(0)
-        f.write(json.dumps(old_data, indent=4))
-        f.truncate()
+    """
+    Saves each container definition in :data: to it's own file in
+    environment.get_path('CUSTOM_CONTAINERS_DIR'), replacing it atomically
+    """
+    # Makes sure the index knows which containers are in CONTAINERS_FILE
+    persisted_containers.reload_persisted_containers_from_disk()
+
+    for name, definition in data.items():
+        atomic_write(
+            get_custom_container_path(name),
+            json.dumps({'containers': {name: definition}}, indent=4))
+
+        # Containers used to be saved together to CONTAINERS_FILE,
+        # the new definition must not compete with an old one there
+        legacy_path = environment.settings['CONTAINERS_FILE']
+        if persisted_containers.persisted_containers_dict.get_file(name) \
+                == legacy_path:
+            with open(legacy_path) as f:
+                old_data = json.load(f, object_pairs_hook=OrderedDict)
+            old_data['containers'].pop(name, None)
+            atomic_write(legacy_path, json.dumps(old_data, indent=4))
+
+
+def get_custom_container_path(name):
+    """
+    Returns path of the file storing custom container :name:
+    """
+    file_name = re.sub(r'[^\w.-]', '_', name)
+    if file_name != name:
+        # Keep names that differ only in replaced characters apart
+        file_name += '-' + hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(
+        environment.get_path('CUSTOM_CONTAINERS_DIR'), file_name + '.json')
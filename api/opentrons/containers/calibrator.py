@@ -1,7 +1,7 @@
-import copy
-from opentrons.util.vector import Vector
+from opentrons.util.vector import Vector, VectorArray
 
-from opentrons.containers.placeable import unpack_location
+from opentrons.containers.placeable import unpack_location, WellSeries
+from opentrons.containers.well_index import WellIndex
 
 
 def apply_calibration(calibration_data,
@@ -11,26 +11,243 @@ def apply_calibration(calibration_data,
     return calibrator.convert(calibration_data, placeable, coordinates)
 
 
+class CalibrationSnapshot(object):
+    """
+    Calibration data of a :Calibrator:, nested dicts of
+    {name: {'delta': Vector, 'type': str, 'children': {...}}}
+    from the deck down
+
+    Snapshots never change, :with_delta: returns a new snapshot
+    which shares every untouched dict with this one. Keeping a snapshot
+    around to branch from is free and :diff: skips shared subtrees,
+    so it is as fast as there are differences
+    >>> from opentrons.containers.calibrator import CalibrationSnapshot
+    >>> from opentrons.util.vector import Vector
+    >>> base = CalibrationSnapshot(
+    ...     {'A1': {'children': {'plate': {'delta': Vector(1, 0, 0)}}}})
+    >>> what_if = base.with_delta(['A1', 'plate'], Vector(1, 0, 2))
+    >>> base.diff(what_if)
+    {('A1', 'plate'): ((x=1.00, y=0.00, z=0.00), (x=1.00, y=0.00, z=2.00))}
+    """
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else {}
+
+    def get(self, path):
+        """
+        Returns the calibration dict saved for :path: (list of names
+        from the deck down), or *None*
+        """
+        node = {'children': self.data}
+        for name in path:
+            node = node.get('children', {}).get(name)
+            if node is None:
+                return None
+        return node
+
+    def with_delta(self, path, delta, placeable_type=None):
+        """
+        Returns a new snapshot with :delta: saved for :path:, copying
+        only the dicts on the way down to it
+        """
+        root = {'children': self.data}
+        node = root
+        for i, name in enumerate(path):
+            children = dict(node.get('children', {}))
+            node['children'] = children
+            if name in children:
+                children[name] = dict(children[name])
+            elif i == len(path) - 1:
+                children[name] = {}
+            else:
+                children[name] = {'children': {}}
+            node = children[name]
+
+        node['delta'] = Vector(delta)
+        if placeable_type is not None:
+            node['type'] = placeable_type
+        return CalibrationSnapshot(root['children'])
+
+    def diff(self, other):
+        """
+        Returns {path: (delta, other_delta)} of paths calibrated
+        differently in :other:, delta is *None* where there is none
+        """
+        res = {}
+        self._diff(self.data, other.data, (), res)
+        return res
+
+    @classmethod
+    def _diff(cls, children, other_children, path, res):
+        if children is other_children:
+            return
+        for name in set(children) | set(other_children):
+            node = children.get(name, {})
+            other_node = other_children.get(name, {})
+            if node is other_node:
+                continue
+
+            child_path = path + (name,)
+            delta = node.get('delta')
+            other_delta = other_node.get('delta')
+            if (delta is None) != (other_delta is None) or \
+                    (delta is not None and delta != other_delta):
+                res[child_path] = (delta, other_delta)
+            cls._diff(
+                node.get('children', {}),
+                other_node.get('children', {}),
+                child_path,
+                res)
+
+
 class Calibrator(object):
     def __init__(self, placeable, calibration_data):
         self.calibrated_coordinates = {}
+        # Calibrated offsets of containers relative to deck, offsets of
+        # wells are one addition away, see :convert:. Kept up to date by
+        # :calibrate: and :add_container:
+        self.container_offsets = {}
+        # Calibrated furthermost points of containers relative to deck
+        # and the furthermost point of them all, see :max_dimensions:
+        self._max_dimensions = {}
+        self._deck_max_dimensions = None
+        self._well_index = None
         self.calibration_data = calibration_data
         self.root_placeable = placeable
         self._apply_calibration(calibration_data, placeable)
 
+        for container in self._containers():
+            self.container_offsets[container] = \
+                self._trace_offset(container)
+
     # Returns calibrated coordinates relative to deck
     def convert(self,
                 placeable,
                 coordinates=Vector(0, 0, 0)):
         coordinates = Vector(coordinates)
-        path = placeable.get_trace()
+        if isinstance(placeable, WellSeries):
+            placeable = placeable.values[placeable.offset]
+
+        adjusted_coordinates = self.container_offsets.get(placeable)
+        if adjusted_coordinates is None:
+            container_offset = self.container_offsets.get(placeable.parent)
+            if container_offset is None:
+                adjusted_coordinates = self._trace_offset(placeable)
+            else:
+                adjusted_coordinates = container_offset + \
+                    self.calibrated_coordinates.get(
+                        placeable, placeable._coordinates)
 
+        return coordinates + adjusted_coordinates
+
+    def _trace_offset(self, placeable):
+        """
+        Returns calibrated offset of :placeable: relative to deck,
+        walking all the way up
+        """
         adjusted_coordinates = Vector(0, 0, 0)
-        for item in path:
+        for item in placeable.get_trace():
             c = self.calibrated_coordinates.get(item, item._coordinates)
             adjusted_coordinates += c
+        return adjusted_coordinates
 
-        return coordinates + adjusted_coordinates
+    def _containers(self):
+        if hasattr(self.root_placeable, 'containers'):
+            return self.root_placeable.containers().values()
+        return []
+
+    def add_container(self, container):
+        """
+        Applies calibration to a :container: added to deck after
+        the :Calibrator: was created, or added again. Containers
+        removed from deck since are forgotten
+        """
+        for known in list(self.container_offsets):
+            if known is container or not self._is_attached(known):
+                self._forget_container(known)
+
+        parent = container.get_parent()
+        data = {'children': self.calibration_data}
+        for name in parent.get_path(self.root_placeable):
+            data = data.get('children', {}).get(name, {})
+        name = container.get_name()
+        children = data.get('children', {})
+        if name in children:
+            self._apply_calibration({name: children[name]}, parent)
+
+        self.container_offsets[container] = self._trace_offset(container)
+        self._deck_max_dimensions = None
+        if self._well_index:
+            self._well_index.add_container(container)
+
+    def _is_attached(self, placeable):
+        """
+        Returns *True* if :placeable: is still below the root placeable,
+        removed placeables keep the link to their parent
+        """
+        while placeable is not self.root_placeable:
+            parent = placeable.get_parent()
+            if parent is None or \
+                    placeable not in parent.children_by_reference:
+                return False
+            placeable = parent
+        return True
+
+    def _forget_container(self, container):
+        """
+        Forgets calibration of :container: and it's wells
+        """
+        self.container_offsets.pop(container, None)
+        self.calibrated_coordinates.pop(container, None)
+        for well in container:
+            self.calibrated_coordinates.pop(well, None)
+
+        self._max_dimensions.pop(container, None)
+        self._deck_max_dimensions = None
+        if self._well_index:
+            self._well_index.remove_container(container)
+
+    def convert_all(self, container, coordinates):
+        """
+        Same as :convert: for many points relative to :container: at once,
+        :coordinates: is a :VectorArray:, e.g. from :Container.wells_top:
+        >>> calibrator.convert_all(plate, plate.wells_top())
+        """
+        if not isinstance(coordinates, VectorArray):
+            coordinates = VectorArray.from_vectors(coordinates)
+        return coordinates + self.convert(container)
+
+    def max_dimensions(self, container=None):
+        """
+        Returns calibrated furthermost (x, y, z) point of :container:
+        relative to deck, or of all containers on deck if *None* is given
+        """
+        if container is None:
+            if self._deck_max_dimensions is None:
+                boxes = [
+                    self.max_dimensions(c)
+                    for c in self.root_placeable.containers().values()]
+                self._deck_max_dimensions = Vector(0, 0, 0)
+                if boxes:
+                    self._deck_max_dimensions = Vector([
+                        max([box[axis] for box in boxes])
+                        for axis in range(3)])
+            return self._deck_max_dimensions
+
+        res = self._max_dimensions.get(container)
+        if res is None:
+            res = self.convert(
+                container, container.max_dimensions(container))
+            self._max_dimensions[container] = res
+        return res
+
+    def well_index(self):
+        """
+        Returns :WellIndex: of all wells on deck in calibrated coordinates
+        """
+        if self._well_index is None:
+            self._well_index = WellIndex(self.root_placeable, calibrator=self)
+        return self._well_index
 
     def _apply_calibration(self, calibration_data, placeable):
         for name, data in calibration_data.items():
@@ -47,29 +264,77 @@ class Calibrator(object):
                   calibration_data,
                   location,
                   actual):
-        actual = Vector(actual)
-        placeable, expected = unpack_location(location)
-        coordinates_to_deck = placeable.coordinates(placeable.get_deck())
-        expected_to_deck = expected + coordinates_to_deck
+        return self.calibrate_all(calibration_data, [(location, actual)])
 
-        delta = actual - expected_to_deck
-        path = placeable.get_path()
-        calibration_data = copy.deepcopy(calibration_data)
+    def calibrate_all(self, calibration_data, positions):
+        """
+        Same as :calibrate: for a list of (location, actual) :positions:,
+        containers are moved just once
 
-        current = {'children': calibration_data}
-        for i, name in enumerate(path):
-            children = current['children']
-            if name not in children:
-                if i == len(path) - 1:
-                    children[name] = {}
-                else:
-                    children[name] = {'children': {}}
-            current = children[name]
-
-        current['delta'] = delta
-        current['type'] = placeable.get_type()
+        :calibration_data: is not changed, the returned calibration data
+        shares everything but the calibrated paths with it, see
+        :CalibrationSnapshot:
+        """
+        snapshot = CalibrationSnapshot(calibration_data)
+        calibrated = set()
+
+        for location, actual in positions:
+            actual = Vector(actual)
+            placeable, expected = unpack_location(location)
+            coordinates_to_deck = placeable.coordinates(placeable.get_deck())
+            expected_to_deck = expected + coordinates_to_deck
+
+            delta = actual - expected_to_deck
+            snapshot = snapshot.with_delta(
+                placeable.get_path(), delta, placeable.get_type())
+
+            self.calibrated_coordinates[placeable] = \
+                placeable._coordinates + delta
+            calibrated.add(placeable)
+        self.calibration_data = snapshot.data
+
+        self._move(calibrated)
+        return snapshot.data
+
+    def use_calibration(self, calibration_data):
+        """
+        Switches to :calibration_data:, e.g. the data of a
+        :CalibrationSnapshot:, updating only what it calibrates
+        differently from the current calibration data
+        """
+        changes = CalibrationSnapshot(self.calibration_data).diff(
+            CalibrationSnapshot(calibration_data))
         self.calibration_data = calibration_data
 
-        self._apply_calibration(calibration_data, self.root_placeable)
+        calibrated = set()
+        for path, (_, delta) in changes.items():
+            placeable = self.root_placeable
+            for name in path:
+                placeable = placeable.get_child_by_name(name)
+                if placeable is None:
+                    break
+            if placeable is None:
+                continue
 
+            if delta is None:
+                self.calibrated_coordinates.pop(placeable, None)
+            else:
+                self.calibrated_coordinates[placeable] = \
+                    placeable._coordinates + delta
+            calibrated.add(placeable)
+
+        self._move(calibrated)
         return calibration_data
+
+    def _move(self, calibrated):
+        """
+        Updates offsets of containers at or below :calibrated: placeables
+        """
+        for container in list(self.container_offsets):
+            if calibrated.intersection(container.get_trace()):
+                self.container_offsets[container] = \
+                    self._trace_offset(container)
+                self._max_dimensions.pop(container, None)
+                if self._well_index:
+                    self._well_index.add_container(container)
+        self._deck_max_dimensions = None
@@ -1,17 +1,137 @@
 from collections import OrderedDict
+from collections.abc import MutableMapping
 import copy
+import hashlib
+import io
 import json
 import numbers
 import os
+import pickle
 import pkg_resources
+import threading
 
-from opentrons.containers.placeable import Container, Well
+from opentrons.containers.placeable import (
+    Container,
+    Well,
+    _SharedProperties,
+    normalize_properties
+)
 from opentrons.util import environment
+from opentrons.util.files import atomic_write
+from opentrons.util.log import get_logger
+
+
+log = get_logger(__name__)
 
 
-persisted_containers_dict = {}
+class ContainerDefinitions(MutableMapping):
+    """
+    Container records by name, see :normalize_container_definition:,
+    each read the first time it is used
+
+    Files added with :add_file: are only indexed, the index tells where
+    a record is stored in the file's cache, see :index_containers_file:
+    """
+    def __init__(self):
+        # name -> location of the definition, see :index_containers_file:
+        self._index = OrderedDict()
+        # name -> records already read or set directly
+        self._definitions = {}
+        # file path -> index of all definitions in the file, including
+        # ones replaced by later files
+        self._file_indexes = {}
+
+    def add_file(self, file_path):
+        """
+        Indexes definitions in :file_path:, they replace definitions
+        of the same name added before. Returns names of the definitions
+        """
+        index = index_containers_file(file_path)
+        self._file_indexes[file_path] = index
+        for name, location in index.items():
+            self._index[name] = location
+            self._definitions.pop(name, None)
+        return list(index)
+
+    def get_file(self, name):
+        """
+        Returns path of the file :name: was indexed from, or *None*
+        """
+        location = self._index.get(name)
+        return location[1] if location else None
+
+    def remove_file(self, file_path):
+        """
+        Drops definitions indexed from :file_path:, returns their names
+        """
+        names = [
+            name for name, location in self._index.items()
+            if location and location[1] == file_path]
+        for name in names:
+            del self[name]
+        self._file_indexes.pop(file_path, None)
+        return names
+
+    def reindex(self, names, file_list):
+        """
+        Points each of :names: indexed from a file to its definition in
+        the last of :file_list: having it, so definitions replaced by
+        a removed or changed file come back
+        """
+        for name in names:
+            if self._index.get(name, False) is None:
+                # Set directly, not from a file
+                continue
+            locations = [
+                self._file_indexes[file_path][name]
+                for file_path in file_list
+                if name in self._file_indexes.get(file_path, {})]
+            if not locations:
+                self._index.pop(name, None)
+                self._definitions.pop(name, None)
+            elif self._index.get(name) != locations[-1]:
+                self._index[name] = locations[-1]
+                self._definitions.pop(name, None)
+
+    def __getitem__(self, name):
+        definition = self._definitions.get(name)
+        if definition is None:
+            definition = load_container_definition(self._index[name])
+            self._definitions[name] = definition
+        return definition
+
+    def __setitem__(self, name, definition):
+        self._index[name] = None
+        self._definitions[name] = definition
+
+    def __delitem__(self, name):
+        del self._index[name]
+        self._definitions.pop(name, None)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+
+persisted_containers_dict = ContainerDefinitions()
 persisted_containers_file_list = []
 
+# file path -> (modification time, size) of files when they were loaded
+persisted_containers_file_stats = {}
+
+# Serializes loading, :start_persisted_containers_poller: loads in
+# a background thread
+persisted_containers_lock = threading.RLock()
+
+# Containers built from definitions, by name. They are never handed out,
+# :get_persisted_container: returns their clones
+persisted_container_prototypes = {}
+
 
 def load_persisted_containers_from_file_list(file_list):
     for file_name in file_list:
@@ -19,22 +139,230 @@ def load_persisted_containers_from_file_list(file_list):
 
 
 def load_all_persisted_containers_from_disk():
-    persisted_containers_file_list.clear()
-    persisted_containers_file_list.extend(
-        [persisted_containers_json_path] + get_custom_container_files()
-    )
+    with persisted_containers_lock:
+        persisted_containers_file_list.clear()
+        persisted_containers_file_list.extend(
+            [persisted_containers_json_path] + get_custom_container_files()
+        )
+        persisted_containers_file_stats.clear()
 
-    load_persisted_containers_from_file_list(
-        persisted_containers_file_list
-    )
+        load_persisted_containers_from_file_list(
+            persisted_containers_file_list
+        )
 
 
 def load_persisted_containers_from_file_path(file_path):
+    with persisted_containers_lock:
+        stat = get_file_stat(file_path)
+        persisted_container_prototypes.clear()
+        persisted_containers_dict.add_file(file_path)
+        persisted_containers_file_stats[file_path] = stat
+
+
+def reload_persisted_containers_from_disk():
+    """
+    Loads container files added or changed since they were loaded
+    and drops containers of removed files, leaving unchanged files
+    alone. Returns names of containers that were reloaded or dropped
+
+    Files are compared by modification time and size
+    """
+    with persisted_containers_lock:
+        file_list = \
+            [persisted_containers_json_path] + get_custom_container_files()
+        names = []
+
+        removed = [
+            file_path for file_path in persisted_containers_file_list
+            if file_path not in file_list]
+        for file_path in removed:
+            names.extend(persisted_containers_dict.remove_file(file_path))
+            persisted_containers_file_stats.pop(file_path, None)
+
+        for file_path in file_list:
+            try:
+                stat = get_file_stat(file_path)
+            except OSError:
+                # Removed while we were looking
+                continue
+            if persisted_containers_file_stats.get(file_path) != stat:
+                # Containers deleted from the file must go as well
+                names.extend(persisted_containers_dict.remove_file(file_path))
+                names.extend(persisted_containers_dict.add_file(file_path))
+                persisted_containers_file_stats[file_path] = stat
+
+        persisted_containers_file_list[:] = file_list
+        names = list(OrderedDict.fromkeys(names))
+        # Definitions the dropped ones replaced come back, and changed
+        # files don't replace definitions of files after them
+        persisted_containers_dict.reindex(names, file_list)
+        for name in names:
+            persisted_container_prototypes.pop(name, None)
+
+        return names
+
+
+def start_persisted_containers_poller(interval=2.0):
+    """
+    Calls :reload_persisted_containers_from_disk: every :interval:
+    seconds from a daemon thread, so new and changed custom containers
+    can be loaded without a restart
+
+    Returns :threading.Event:, set it to stop polling
+    >>> stop = start_persisted_containers_poller()
+    >>> stop.set()
+    """
+    should_stop = threading.Event()
+
+    def poll():
+        last_error = None
+        while not should_stop.wait(interval):
+            try:
+                reload_persisted_containers_from_disk()
+                last_error = None
+            except Exception as e:
+                # Files are often caught half written, retry on the
+                # next round and only report an error once
+                if str(e) != last_error:
+                    log.exception('Failed to reload containers')
+                last_error = str(e)
+
+    threading.Thread(target=poll, daemon=True).start()
+    return should_stop
+
+
+def get_file_stat(file_path):
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Bump when the layout of cache files changes
+CONTAINERS_CACHE_VERSION = 3
+
+
+def read_containers_file(file_path):
+    """
+    Parses all container definitions in :file_path:
+    """
     with open(file_path) as f:
-        persisted_containers_dict.update(json.load(
+        return json.load(
             f,
             object_pairs_hook=OrderedDict
-        )['containers'])
+        )['containers']
+
+
+def compile_containers_file(file_path):
+    """
+    Parses :file_path: and returns OrderedDict of container names to
+    records of their definitions, see :normalize_container_definition:
+    """
+    return OrderedDict(
+        (name, normalize_container_definition(
+            definition, '{} "{}"'.format(file_path, name)))
+        for name, definition in read_containers_file(file_path).items())
+
+
+def index_containers_file(file_path):
+    """
+    Returns OrderedDict of container names in :file_path: to locations
+    of their records for :load_container_definition:
+
+    Definitions are compiled to records by :compile_containers_file:
+    and pickled one by one to a cache file in
+    environment.get_path('CONTAINERS_CACHE_DIR'), the location is the
+    byte offset of the record in it. :file_path: is compiled again
+    only when it's modification time or size change
+
+    If the cache can't be written, locations hold the records of the
+    whole file instead of an offset, so it is compiled only once
+    """
+    stat = os.stat(file_path)
+    key = (
+        CONTAINERS_CACHE_VERSION,
+        os.path.abspath(file_path),
+        stat.st_mtime_ns,
+        stat.st_size
+    )
+    cache_path = get_containers_cache_path(file_path)
+
+    offsets = None
+    try:
+        with open(cache_path, 'rb') as f:
+            if pickle.load(f) == key:
+                offsets = pickle.load(f)
+                start = f.tell()
+    except Exception:
+        # Missing, unreadable or corrupted cache, rebuild it
+        pass
+
+    if offsets is None:
+        containers = compile_containers_file(file_path)
+        start, offsets = write_containers_cache(cache_path, key, containers)
+        if offsets is None:
+            # Cache is not writable, keep the records we compiled
+            return OrderedDict(
+                (name, (name, file_path, None, None, containers))
+                for name in containers)
+
+    return OrderedDict(
+        (name, (name, file_path, cache_path, key, start + offset))
+        for name, offset in offsets.items())
+
+
+def load_container_definition(location):
+    """
+    Returns the record at :location: from :index_containers_file:,
+    compiling the source file if the cache file changed since
+    """
+    name, file_path, cache_path, key, offset = location
+    if cache_path is None and offset is not None:
+        # Records of the file, see :index_containers_file:
+        return offset[name]
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) == key:
+                    f.seek(offset)
+                    return pickle.load(f)
+        except Exception:
+            pass
+    return compile_containers_file(file_path)[name]
+
+
+def get_containers_cache_path(file_path):
+    file_hash = hashlib.sha1(
+        os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(
+        environment.get_path('CONTAINERS_CACHE_DIR'),
+        file_hash + '.pickle')
+
+
+def write_containers_cache(cache_path, key, containers):
+    """
+    Atomically replaces :cache_path: with :key:, the index of
+    definitions in :containers: and the definitions themselves
+
+    Returns the byte offset of the first definition and offsets of
+    definitions relative to it, or (None, None) if the cache
+    directory is not writable
+    """
+    definitions = io.BytesIO()
+    offsets = OrderedDict()
+    for name, definition in containers.items():
+        offsets[name] = definitions.tell()
+        pickle.dump(definition, definitions, pickle.HIGHEST_PROTOCOL)
+
+    header = io.BytesIO()
+    pickle.dump(key, header, pickle.HIGHEST_PROTOCOL)
+    pickle.dump(offsets, header, pickle.HIGHEST_PROTOCOL)
+    start = header.tell()
+
+    try:
+        atomic_write(cache_path, header.getvalue() + definitions.getvalue())
+    except OSError:
+        return None, None
+
+    return start, offsets
 
 
 containers_dir_path = pkg_resources.resource_filename(
@@ -60,7 +388,7 @@ def get_custom_container_files():
 
     top = environment.get_path('CONTAINERS_DIR')
     for root, dirnames, files in os.walk(top):
-        for name in filter(is_special_file, dirnames):
+        for name in list(filter(is_special_file, dirnames)):
             dirnames.remove(name)
 
         res.extend(
@@ -73,26 +401,58 @@ def get_custom_container_files():
 
 
 def get_persisted_container(container_name: str) -> Container:
-    container_data = persisted_containers_dict.get(container_name)
-    if not container_data:
-        raise ValueError(
-            ('Container type "{}" not found in files: {}')
-            .format(container_name, persisted_containers_file_list)
-        )
-    return create_container_obj_from_dict(container_data)
+    with persisted_containers_lock:
+        prototype = persisted_container_prototypes.get(container_name)
+        if prototype is None:
+            record = persisted_containers_dict.get(container_name)
+            if not record:
+                raise ValueError(
+                    ('Container type "{}" not found in files: {}')
+                    .format(container_name, persisted_containers_file_list)
+                )
+            prototype = create_container_obj_from_record(record)
+            persisted_container_prototypes[container_name] = prototype
+
+    return prototype.clone()
+
+
+def validate_persisted_containers(file_list=None):
+    """
+    Returns the list of problems with container definitions in all of
+    :file_list:, or in files loaded from disk if *None* is given
+
+    Definitions are validated once, when they are compiled, so this
+    only collects what was found
+    """
+    if file_list is None:
+        file_list = persisted_containers_file_list
+
+    errors = []
+    for file_path in file_list:
+        try:
+            index = index_containers_file(file_path)
+        except (OSError, ValueError, KeyError) as e:
+            errors.append('{}: {!r}'.format(file_path, e))
+            continue
+        for location in index.values():
+            errors.extend(load_container_definition(location)['errors'])
+    return errors
 
 
 def list_container_names():
-    c_list = [n for n in persisted_containers_dict.keys()]
+    with persisted_containers_lock:
+        c_list = [n for n in persisted_containers_dict.keys()]
     return sorted(c_list, key=lambda s: s.lower())
 
 
 def load_all_persisted_containers():
+    with persisted_containers_lock:
+        records = list(persisted_containers_dict.items())
     containers = []
-    for container_name, container_data in persisted_containers_dict.items():
+    for container_name, record in records:
         try:
             containers.append(
-                create_container_obj_from_dict(container_data)
+                create_container_obj_from_record(record)
             )
         except Exception as e:
             print('Failed to load container: {}'.format(container_name))
@@ -161,46 +521,175 @@ def create_container_obj_from_dict(container_data: dict) -> Container:
                "total-liquid-volume":22000
             }
     """
-    container_data = copy.deepcopy(container_data)
-    origin_offset_x = container_data.get('origin-offset', {}).get('x') or 0
-    origin_offset_y = container_data.get('origin-offset', {}).get('y') or 0
+    record = normalize_container_definition(container_data)
+    return create_container_obj_from_record(record)
+
+
+# Well properties that must be numbers if present
+NUMERIC_WELL_PROPERTIES = (
+    'radius',
+    'diameter',
+    'depth',
+    'length',
+    'width',
+    'height',
+    'total-liquid-volume'
+)
+
+
+def normalize_container_definition(container_data, source='container'):
+    """
+    Validates a container definition, as in :create_container_obj_from_dict:,
+    and converts it to a record containers are built from without
+    further checks:
+
+    {
+        'wells': [(name, (x, y, z), properties), ...],
+        'errors': [message, ...]
+    }
+
+    (x, y, z) are of the bottom-left corner of a well relative to the
+    container, and properties went through :normalize_properties:, with
+    wells of the same shape sharing one dict.
+
+    All problems are collected in 'errors', prefixed with :source:,
+    instead of stopping at the first one. A record with errors has
+    no wells
+    """
+    errors = []
+
+    def error(message, *args):
+        errors.append('{}: {}'.format(source, message.format(*args)))
+
+    if not isinstance(container_data, dict):
+        error('expected an object, got {!r}', container_data)
+        return {'wells': [], 'errors': errors}
+
+    origin_offset_x, origin_offset_y = _check_origin_offset(
+        container_data, error)
 
-    container = Container()
     locations = container_data.get('locations')
+    if not isinstance(locations, dict):
+        error('"locations" is not an object')
+        locations = {}
 
-    for well_name, well_properties in locations.items():
-        x = well_properties.pop('x')
-        y = well_properties.pop('y')
-        z = well_properties.pop('z')
+    wells = []
+    # Wells of the same shape share one properties dict
+    shared_properties = {}
 
-        # assert 'depth' in well_properties
-        # assert 'diameter' in well_properties
-        # assert 'length' in well_properties
-        # assert 'width' in well_properties
-        # assert 'total-liquid-volume' in well_properties
-        assert isinstance(x, numbers.Number)
-        assert isinstance(y, numbers.Number)
-        assert isinstance(z, numbers.Number)
+    for well_name, well_properties in locations.items():
+        well = _check_well(well_name, well_properties, error)
+        if errors:
+            continue
 
-        well = Well(properties=well_properties)
+        coordinates, properties = well
+        properties = _share_properties(
+            shared_properties, normalize_properties(properties))
+        x, y, z = coordinates
 
         # subtract half the size, because
         # Placeable assigns X-Y to bottom-left corner, but
         # persisted container files assign X-Y to center of each Well
-        x -= (well.x_size() / 2)
-        y -= (well.y_size() / 2)
+        wells.append((
+            well_name,
+            (
+                x - properties['width'] / 2 + origin_offset_x,
+                y - properties['length'] / 2 + origin_offset_y,
+                z
+            ),
+            properties
+        ))
+
+    if errors:
+        wells = []
+    return {'wells': wells, 'errors': errors}
 
-        well_coordinates = (
-            x + origin_offset_x,
-            y + origin_offset_y,
-            z
-        )
 
-        container.add(well, well_name, well_coordinates)
+def _is_number(value):
+    return isinstance(value, numbers.Number)
+
+
+def _check_origin_offset(container_data, error):
+    """
+    Returns x and y of "origin-offset" of :container_data:, reporting
+    problems with it to :error:
+    """
+    origin_offset = container_data.get('origin-offset') or {}
+    if not isinstance(origin_offset, dict):
+        error('"origin-offset" is not an object')
+        origin_offset = {}
+    origin_offset_x = origin_offset.get('x') or 0
+    origin_offset_y = origin_offset.get('y') or 0
+    for axis, value in (('x', origin_offset_x), ('y', origin_offset_y)):
+        if not _is_number(value):
+            error('"origin-offset" {} is not a number: {!r}', axis, value)
+    return origin_offset_x, origin_offset_y
+
+
+def _check_well(well_name, well_properties, error):
+    """
+    Returns coordinates of a well and a copy of :well_properties: without
+    them, reporting problems with the well to :error:. Returns *None* if
+    the well is not an object
+    """
+    if not isinstance(well_properties, dict):
+        error('well {} is not an object', well_name)
+        return None
+
+    properties = copy.deepcopy(well_properties)
+    coordinates = [properties.pop(axis, None) for axis in 'xyz']
+    for axis, value in zip('xyz', coordinates):
+        if axis not in well_properties:
+            error('well {} has no {}', well_name, axis)
+        elif not _is_number(value):
+            error('well {} {} is not a number: {!r}',
+                  well_name, axis, value)
+    for key in NUMERIC_WELL_PROPERTIES:
+        if key in properties and not _is_number(properties[key]):
+            error('well {} {} is not a number: {!r}',
+                  well_name, key, properties[key])
+    return coordinates, properties
+
+
+def create_container_obj_from_record(record) -> Container:
+    """
+    Builds :Container: from a record of :normalize_container_definition:,
+    raising ValueError with all of it's errors if it has any
+    """
+    if record['errors']:
+        raise ValueError('\n'.join(record['errors']))
+
+    container = Container()
+    # id(properties dict of record) -> read-only copy shared by wells
+    shared_properties = {}
+    for well_name, coordinates, properties in record['wells']:
+        shared = shared_properties.get(id(properties))
+        if shared is None:
+            shared = shared_properties[id(properties)] = \
+                _SharedProperties(properties)
+        container.add(
+            Well.from_normalized_properties(shared),
+            well_name,
+            coordinates)
+
+    container.build_well_geometry()
 
     return container
 
 
+def _share_properties(shared_properties, properties):
+    """
+    Returns a dict equal to :properties: from :shared_properties:,
+    adding :properties: to it if it's the first of it's kind
+    """
+    try:
+        key = tuple(sorted(properties.items()))
+    except TypeError:
+        # Unhashable or unorderable values, don't share
+        return properties
+    return shared_properties.setdefault(key, properties)
+
+
 # Load default persisted containers from API distribution
 # and whatever containers we find in environment.get_path('CONTAINERS_DIR')
 load_all_persisted_containers_from_disk()
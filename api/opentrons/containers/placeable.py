@@ -1,13 +1,57 @@
 import itertools
 import math
 import numbers
+from array import array
 from collections import OrderedDict
-from opentrons.util.vector import Vector
+from collections.abc import Mapping, Sequence
+from opentrons.util.vector import Vector, VectorArray
 
 import re
 import functools
 
 
+class _NoChildren(Mapping):
+    """
+    Read-only empty mapping shared by every placeable until it gets
+    it's first child, most placeables are wells and never do
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __reduce__(self):
+        # Unpickle and copy back to the module-level instance
+        return '_NO_CHILDREN'
+
+
+_NO_CHILDREN = _NoChildren()
+
+
+class _SharedProperties(dict):
+    """
+    Read-only properties dict shared by many wells, e.g. all wells of
+    the same shape in a container. :Placeable.properties: hands out
+    a copy of it, so changing one well does not change the others
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Shared well properties are read-only')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (_SharedProperties, (dict(self),))
+
+
 def unpack_location(location):
     """
     Returns (:Placeable:, :Vector:) tuple
@@ -33,6 +77,32 @@ def humanize_location(location):
     return repr(well)
 
 
+def normalize_properties(properties):
+    """
+    Fills in :width:, :length: and :height: of :properties: in place from
+    :radius:, :diameter: or :depth:, and 0 for whatever is missing
+    """
+    if 'radius' in properties:
+        properties['width'] = properties['radius'] * 2
+        properties['length'] = properties['radius'] * 2
+
+    if 'diameter' in properties:
+        properties['width'] = properties['diameter']
+        properties['length'] = properties['diameter']
+
+    if 'depth' in properties:
+        properties['height'] = properties['depth']
+
+    for dimension in ['length', 'width', 'height']:
+        if dimension not in properties:
+            properties[dimension] = 0
+
+    return properties
+
+
+_ZERO_COORDINATES = Vector(0, 0, 0)
+
+
 class Placeable(object):
     """
     This class represents every item on the deck:
@@ -44,6 +114,18 @@ class Placeable(object):
     * calculate coordinates in different reference systems
     """
 
+    __slots__ = (
+        'children_by_name',
+        'children_by_reference',
+        '_children_list',
+        '_children_index',
+        'parent',
+        '_properties',
+        '_coordinates',
+        '_coordinates_cache',
+        '__weakref__'
+    )
+
     def __init__(self, parent=None, properties=None):
         """
         Initiaize placeable.
@@ -54,33 +136,59 @@ class Placeable(object):
         """
 
         # For performance optimization reasons we are tracking children
-        # by name and by reference
-        self.children_by_name = OrderedDict()
-        self.children_by_reference = OrderedDict()
+        # by name and by reference, as well as in order of addition with
+        # a name to position index. All are allocated by :add:
+        self.children_by_name = _NO_CHILDREN
+        self.children_by_reference = _NO_CHILDREN
+        self._children_list = ()
+        self._children_index = _NO_CHILDREN
         self._coordinates = Vector(0, 0, 0)
-        self._max_dimensions = {}
+
+        # Coordinates are memoized per tree, keyed by (placeable, reference).
+        # Every placeable in a tree shares the same dict, which is cleared
+        # whenever the tree changes shape (see :add: and :remove_child:)
+        self._coordinates_cache = {}
 
         self.parent = parent
 
         if properties is None:
             properties = {}
 
-        self.properties = properties
+        self.properties = normalize_properties(properties)
 
-        if 'radius' in properties:
-            properties['width'] = properties['radius'] * 2
-            properties['length'] = properties['radius'] * 2
+    @classmethod
+    def from_normalized_properties(cls, properties):
+        """
+        Creates a :Placeable: without a parent from :properties: that
+        went through :normalize_properties: already
 
-        if 'diameter' in properties:
-            properties['width'] = properties['diameter']
-            properties['length'] = properties['diameter']
+        Meant for :Well:s, which have no state other than :Placeable:'s
+        """
+        placeable = object.__new__(cls)
+        placeable.children_by_name = _NO_CHILDREN
+        placeable.children_by_reference = _NO_CHILDREN
+        placeable._children_list = ()
+        placeable._children_index = _NO_CHILDREN
+        placeable._coordinates = _ZERO_COORDINATES
+        placeable._coordinates_cache = {}
+        placeable.parent = None
+        placeable.properties = properties
+        return placeable
 
-        if 'depth' in properties:
-            properties['height'] = properties['depth']
+    @property
+    def properties(self):
+        """
+        Returns the :dict: of properties of this placeable, copying
+        it from the one shared with other wells first, if it is shared
+        """
+        properties = self._properties
+        if type(properties) is _SharedProperties:
+            properties = self._properties = dict(properties)
+        return properties
 
-        for dimension in ['length', 'width', 'height']:
-            if dimension not in properties:
-                properties[dimension] = 0
+    @properties.setter
+    def properties(self, properties):
+        self._properties = properties
 
     def __getitem__(self, name):
         """
@@ -90,7 +198,7 @@ class Placeable(object):
         if isinstance(name, slice):
             return self.get_children_from_slice(name)
         elif isinstance(name, int):
-            return self.get_children_list()[name]
+            return self._children_list[name]
         elif isinstance(name, str):
             return self.get_child_by_name(name)
         else:
@@ -114,10 +222,10 @@ class Placeable(object):
         )
 
     def __iter__(self):
-        return iter(self.get_children_list())
+        return iter(self._children_list)
 
     def __len__(self):
-        return len(self.get_children_list())
+        return len(self._children_list)
 
     def __bool__(self):
         return True
@@ -130,28 +238,31 @@ class Placeable(object):
         if not self.get_parent():
             raise Exception('Must have a parent')
 
-        children = self.parent.get_children_list()
-        my_loc = children.index(self)
+        children = self.parent._children_list
+        my_loc = self.parent._children_index.get(self.get_name())
+        if my_loc is None or children[my_loc] is not self:
+            # Our name was taken over by a sibling added after us
+            my_loc = children.index(self)
         return children[my_loc + 1]
 
     def iter(self):
         """
         Returns an iterable built from this Placeable's children list
         """
-        return iter(self.get_children_list())
+        return iter(self._children_list)
 
     def chain(self, *args):
         """
         Returns an itertools.chain built from this Placeable's children list
         and appending any passed lists with *args
         """
-        return itertools.chain(self.get_children_list(), *args)
+        return itertools.chain(self._children_list, *args)
 
     def cycle(self):
         """
         Returns an itertools.cycle from this Placeable's children list
         """
-        return itertools.cycle(self.get_children_list())
+        return itertools.cycle(self._children_list)
 
     def get_name(self):
         """
@@ -166,13 +277,13 @@ class Placeable(object):
         """
         Returns the Placeable's type or class name
         """
-        return self.properties.get('type', self.__class__.__name__)
+        return self._properties.get('type', self.__class__.__name__)
 
     def get_children_list(self):
         """
         Returns the list of children in the order they were added
         """
-        return list(self.children_by_reference.keys())
+        return list(self._children_list)
 
     def get_path(self, reference=None):
         """
@@ -209,8 +320,26 @@ class Placeable(object):
         """
         Returns the coordinates of a :Placeable: relative to :reference:
         """
-        coordinates = [i._coordinates for i in self.get_trace(reference)]
-        return functools.reduce(lambda a, b: a + b, coordinates)
+        key = (self, reference)
+        cache = self._coordinates_cache
+        if key not in cache:
+            coordinates = [i._coordinates for i in self.get_trace(reference)]
+            cache[key] = functools.reduce(lambda a, b: a + b, coordinates)
+        return cache[key]
+
+    def invalidate_coordinates(self):
+        """
+        Drops memoized coordinates for the whole tree :self: belongs to
+        """
+        self._coordinates_cache.clear()
+
+    def _share_coordinates_cache(self, cache):
+        """
+        Makes :self: and all of it's descendants use :cache:
+        """
+        self._coordinates_cache = cache
+        for child in self.children_by_reference:
+            child._share_coordinates_cache(cache)
 
     def add(self, child, name=None, coordinates=Vector(0, 0, 0)):
         """
@@ -222,13 +351,50 @@ class Placeable(object):
         if not name:
             name = str(child)
 
+        if self.children_by_name is _NO_CHILDREN:
+            self.children_by_name = OrderedDict()
+            self.children_by_reference = OrderedDict()
+            self._children_list = []
+            self._children_index = {}
+
         if name in self.children_by_name:
             del self.children_by_name[name]
 
         child._coordinates = Vector(coordinates)
         child.parent = self
         self.children_by_name[name] = child
-        self.children_by_reference[child] = name
+        if child in self.children_by_reference:
+            # Re-added children keep their position
+            self.children_by_reference[child] = name
+            self._index_children()
+        else:
+            self.children_by_reference[child] = name
+            self._children_index[name] = len(self._children_list)
+            self._children_list.append(child)
+
+        self.invalidate_coordinates()
+        if child._coordinates_cache is not self._coordinates_cache:
+            child.invalidate_coordinates()
+            child._share_coordinates_cache(self._coordinates_cache)
+
+    def _clone_leaf(self, parent):
+        """
+        Returns a copy of a :Placeable: without children under :parent:,
+        sharing it's coordinates and a read-only copy of it's properties
+        """
+        clone = object.__new__(self.__class__)
+        clone.children_by_name = _NO_CHILDREN
+        clone.children_by_reference = _NO_CHILDREN
+        clone._children_list = ()
+        clone._children_index = _NO_CHILDREN
+        clone.parent = parent
+        properties = self._properties
+        if type(properties) is not _SharedProperties:
+            properties = self._properties = _SharedProperties(properties)
+        clone._properties = properties
+        clone._coordinates = self._coordinates
+        clone._coordinates_cache = parent._coordinates_cache
+        return clone
 
     def get_deck(self):
         """
@@ -249,6 +415,21 @@ class Placeable(object):
         child = self.children_by_name[name]
         del self.children_by_name[name]
         del self.children_by_reference[child]
+        self._index_children()
+
+        # The removed subtree keeps it's parent link, so it gets a fresh
+        # cache of it's own rather than sharing stale entries with us
+        self.invalidate_coordinates()
+        child._share_coordinates_cache({})
+
+    def _index_children(self):
+        """
+        Rebuilds positional list of children and name to position index
+        """
+        self._children_list = list(self.children_by_reference)
+        self._children_index = {
+            name: i
+            for i, name in enumerate(self.children_by_reference.values())}
 
     def get_parent(self):
         """
@@ -264,10 +445,12 @@ class Placeable(object):
 
     def get_index_from_name(self, name):
         """
-        Retrieves child's name by index
+        Retrieves child's index by name
         """
-        return self.get_children_list().index(
-            self.get_child_by_name(name))
+        index = self._children_index.get(name)
+        if index is None:
+            raise ValueError('{} is not in {}'.format(name, self))
+        return index
 
     def get_children_from_slice(self, s):
         """
@@ -279,7 +462,7 @@ class Placeable(object):
         if isinstance(s.stop, str):
             s = slice(
                 s.start, self.get_index_from_name(s.stop), s.step)
-        return WellSeries(self.get_children_list()[s])
+        return WellSeries(list(self._children_list[s]))
 
     def has_children(self):
         """
@@ -302,25 +485,25 @@ class Placeable(object):
         """
         Returns placeable's maximum liquid volume in uL
         """
-        return self.properties['total-liquid-volume']
+        return self._properties['total-liquid-volume']
 
     def x_size(self):
         """
         Returns placeable's size along X axis
         """
-        return self.properties['width']
+        return self._properties['width']
 
     def y_size(self):
         """
         Returns placeable's size along Y axis
         """
-        return self.properties['length']
+        return self._properties['length']
 
     def z_size(self):
         """
         Returns placeable's size along Z axis
         """
-        return self.properties['height']
+        return self._properties['height']
 
     def get_all_children(self):
         """
@@ -340,31 +523,38 @@ class Placeable(object):
         >>> plate.max_dimensions(reference=deck)
         """
 
-        # Our placeables are considered immuteable, hence we are caching
-        # max dimensions for a given reference to calculate it only once
-        if reference in self._max_dimensions:
-            return self._max_dimensions[reference]
-
         if not self.has_children():
             return (0, 0, 0)
 
-        # Collect all furthermost child coordinates
-        child_coordinates = [
-            child.from_center(x=1, y=1, z=1, reference=reference)
-            for child in self.get_all_children()]
+        if not reference:
+            # Without a reference every child is measured from it's
+            # own origin, which leaves just the sizes
+            sizes = [child.size() for child in self.get_all_children()]
+            return tuple([
+                max([size[axis] for size in sizes]) for axis in range(3)])
 
-        # find furthermost x, y and z
-        res = tuple([
-            max(
-                child_coordinates,
-                key=lambda coordinates: coordinates[axis]
-            )[axis]
-            for axis in range(3)])
+        return tuple(self.coordinates(reference) + self.bounding_box())
 
-        # Cache it
-        self._max_dimensions[reference] = res
+    def bounding_box(self):
+        """
+        Returns the furthermost (x,y,z) point of all children relative
+        to the origin of :self:
 
-        return res
+        Built from children's bounding boxes and memoized alongside
+        coordinates, so it is dropped whenever the tree changes
+        """
+        key = (self, 'bounding-box')
+        cache = self._coordinates_cache
+        if key not in cache:
+            corners = []
+            for child in self._children_list:
+                corners.append(child._coordinates + child.size())
+                if child.has_children():
+                    corners.append(child._coordinates + child.bounding_box())
+            cache[key] = tuple([
+                max([corner[axis] for corner in corners])
+                for axis in range(3)])
+        return cache[key]
 
     def from_polar(self, r, theta, h):
         """
@@ -479,8 +669,12 @@ class Deck(Placeable):
 class Well(Placeable):
     """
     Class representing a Well
+
+    Containers hold hundreds of wells, so wells have no :__dict__:
+    and wells of the same type may share a single read-only properties
+    dict until their properties are first accessed
     """
-    pass
+    __slots__ = ()
 
 
 class Slot(Placeable):
@@ -499,6 +693,146 @@ class Container(Placeable):
         self.grid = None
         self.grid_transposed = None
 
+        # (rows, columns) of well names, containers of the same type
+        # may share it, see :set_grid_layout:
+        self._grid_layout = None
+
+        # Flat [x0, y0, z0, x1, y1, z1, ...] arrays of well offsets
+        # within the container and of well sizes, see :build_well_geometry:
+        self._well_origins = None
+        self._well_sizes = None
+
+    def add(self, child, name=None, coordinates=Vector(0, 0, 0)):
+        super(Container, self).add(child, name, coordinates)
+        self.invalidate_well_geometry()
+        self._grid_layout = None
+        self.invalidate_grid()
+
+    def clone(self):
+        """
+        Returns a copy of the container and it's wells without a parent
+
+        Wells of the copy share read-only properties with wells of the
+        original until either is changed (see :Placeable.properties:),
+        and the copy shares it's well geometry and grid layout, so
+        copying is much cheaper than building a container from scratch.
+        Wells must not have children of their own
+        """
+        clone = self.__class__(properties=dict(self.properties))
+        clone._coordinates = self._coordinates
+
+        children_by_name = OrderedDict()
+        children_by_reference = OrderedDict()
+        for well, name in self.children_by_reference.items():
+            well = well._clone_leaf(clone)
+            children_by_name[name] = well
+            children_by_reference[well] = name
+
+        if children_by_name:
+            clone.children_by_name = children_by_name
+            clone.children_by_reference = children_by_reference
+            clone._children_list = list(children_by_reference)
+            clone._children_index = dict(self._children_index)
+
+            clone._well_origins, clone._well_sizes = self.well_geometry()
+            clone._grid_layout = self.get_grid_layout()
+
+        return clone
+
+    def invalidate_well_geometry(self):
+        """
+        Invalidates pre-calculated well origins and sizes
+        """
+        self._well_origins = None
+        self._well_sizes = None
+
+    def build_well_geometry(self):
+        """
+        Packs offsets and sizes of all wells into flat arrays, in the
+        order wells were added
+        """
+        origins = array('d')
+        sizes = array('d')
+        for well in self.children_by_reference:
+            origins.extend(well._coordinates)
+            sizes.extend((well.x_size(), well.y_size(), well.z_size()))
+        self._well_origins = origins
+        self._well_sizes = sizes
+
+    def well_geometry(self):
+        """
+        Returns (origins, sizes) flat arrays of all wells
+        """
+        if self._well_origins is None:
+            self.build_well_geometry()
+        return self._well_origins, self._well_sizes
+
+    def wells_from_center(self, x=None, y=None, z=None, r=None,
+                          theta=None, h=None, reference=None):
+        """
+        Same as :from_center: for all wells at once, returns a
+        :VectorArray: in the order wells were added
+
+        Coordinates are relative to :reference:, or to the container
+        itself if *None* is given
+        >>> plate.wells_from_center(x=0, y=0, z=1, reference=deck)
+        """
+        cartesian = all([isinstance(i, numbers.Number) for i in (x, y, z)])
+        polar = all([isinstance(i, numbers.Number) for i in (r, theta, h)])
+        if polar:
+            cos_theta, sin_theta = math.cos(theta), math.sin(theta)
+        elif not cartesian:
+            raise ValueError('Expected (x, y, z) or (r, theta, h)')
+
+        offset_x, offset_y, offset_z = 0, 0, 0
+        if reference:
+            offset_x, offset_y, offset_z = self.coordinates(reference)
+
+        origins, sizes = self.well_geometry()
+        res = VectorArray()
+        for i in range(0, len(origins), 3):
+            half_x = sizes[i] / 2.0
+            half_y = sizes[i + 1] / 2.0
+            half_z = sizes[i + 2] / 2.0
+            if polar:
+                end_x = half_x + r * half_x * cos_theta
+                end_y = half_y + r * half_x * sin_theta
+                end_z = half_z + half_z * h
+            else:
+                end_x = half_x + half_x * x
+                end_y = half_y + half_y * y
+                end_z = half_z + half_z * z
+            res.x.append(offset_x + origins[i] + end_x)
+            res.y.append(offset_y + origins[i + 1] + end_y)
+            res.z.append(offset_z + origins[i + 2] + end_z)
+        return res
+
+    def wells_center(self, reference=None):
+        """
+        Returns centers of all wells, see :wells_from_center:
+        """
+        return self.wells_from_center(x=0.0, y=0.0, z=0.0, reference=reference)
+
+    def wells_top(self, z=0, radius=0, degrees=0, reference=None):
+        """
+        Returns tops of all wells, see :top: and :wells_from_center:
+        """
+        return self.wells_from_center(
+            r=radius,
+            theta=(degrees / 180) * math.pi,
+            h=1,
+            reference=reference) + (0, 0, z)
+
+    def wells_bottom(self, z=0, radius=0, degrees=0, reference=None):
+        """
+        Returns bottoms of all wells, see :bottom: and :wells_from_center:
+        """
+        return self.wells_from_center(
+            r=radius,
+            theta=(degrees / 180) * math.pi,
+            h=-1,
+            reference=reference) + (0, 0, z)
+
     def invalidate_grid(self):
         """
         Invalidates pre-calcualted grid structure for rows and colums
@@ -510,13 +844,31 @@ class Container(Placeable):
         """
         Calculates and stores grid structure
         """
+        rows, columns = self.get_grid_layout()
+
         if self.grid is None:
-            self.grid = self.get_wellseries(self.get_grid())
+            self.grid = self.get_wellseries(rows)
 
         if self.grid_transposed is None:
-            self.grid_transposed = self.get_wellseries(
-                self.transpose(
-                    self.get_grid()))
+            self.grid_transposed = self.get_wellseries(columns)
+
+    def get_grid_layout(self):
+        """
+        Returns (rows, columns) grid of well names, calculating it
+        on first use
+        """
+        if self._grid_layout is None:
+            rows = self.get_grid()
+            self._grid_layout = (rows, self.transpose(rows))
+        return self._grid_layout
+
+    def set_grid_layout(self, layout):
+        """
+        Uses a (rows, columns) grid calculated by another container
+        with the same wells, it is not copied and must not be modified
+        """
+        self._grid_layout = layout
+        self.invalidate_grid()
 
     def get_grid(self):
         """
@@ -649,12 +1001,10 @@ class Container(Placeable):
         step = kwargs.get('step', 1)
         length = kwargs.get('length', 1)
 
-        wrapped_wells = [
-            w
-            for i in range(3)
-            for w in self.get_children_list()
-        ]
-        total_kids = len(self.get_children_list())
+        # Positions into the container's wells repeated three times,
+        # wells are resolved by LazyWellSeries only when accessed
+        total_kids = len(self._children_list)
+        wrapped_positions = range(total_kids * 3)
 
         if isinstance(start, str):
             start = self.get_index_from_name(start)
@@ -667,14 +1017,16 @@ class Container(Placeable):
             elif stop < start:
                 stop -= 1
                 step = step * -1 if step > 0 else step
-            return WellSeries(
-                wrapped_wells[start + total_kids:stop + total_kids:step])
+            return LazyWellSeries(
+                self,
+                wrapped_positions[start + total_kids:stop + total_kids:step])
         else:
             if length < 0:
                 length *= -1
                 step = step * -1 if step > 0 else step
-            return WellSeries(
-                wrapped_wells[start + total_kids::step][:length])
+            return LazyWellSeries(
+                self,
+                wrapped_positions[start + total_kids::step][:length])
 
     def _parse_wells_x_y(self, *args, **kwargs):
         x = kwargs.get('x', None)
@@ -705,12 +1057,31 @@ class WellSeries(Container):
         if isinstance(wells, dict):
             self.items = wells
             self.values = list(wells.values())
+            names = list(wells.keys())
         else:
-            self.items = {w.get_name(): w for w in wells}
+            names = [w.get_name() for w in wells]
+            self.items = dict(zip(names, wells))
             self.values = wells
         self.offset = 0
         self.name = name
 
+        # Positional access and name lookups go through the same
+        # structures as for any other :Placeable:
+        self._children_list = self.values
+        self._index_names(names)
+
+    def _index_names(self, names):
+        """
+        Caches :names: of wells, in the order of :values:, along with
+        name -> position and well -> name lookups
+
+        Wells are looked up by identity, the series keeps them alive
+        so their ids can not be reused
+        """
+        self._children_index = {name: i for i, name in enumerate(names)}
+        self._names_by_id = {
+            id(well): name for name, well in zip(names, self.values)}
+
     def set_offset(self, offset):
         """
         Set index of a well that will be used to mimic :Placeable:
@@ -724,8 +1095,9 @@ class WellSeries(Container):
         return str(self)
 
     def __str__(self):
-        return '<{0}: {1}>'.format(
-            self.__class__.__name__,
+        # Not the class name, :LazyWellSeries: must read the same,
+        # this ends up in descriptions of commands
+        return '<WellSeries: {0}>'.format(
             ''.join([str(well) for well in self.values]))
 
     def __getattr__(self, name):
@@ -740,14 +1112,69 @@ class WellSeries(Container):
             return str(self)
         return str(self.name)
 
+    def coordinates(self, reference=None):
+        # Resolve through the current well, memoizing under the series itself
+        # would go stale after :set_offset:
+        return self.values[self.offset].coordinates(reference)
+
     def get_name_by_instance(self, well):
-        for name, value in self.items.items():
-            if value is well:
-                return name
-        return None
+        return self._names_by_id.get(id(well))
 
     def get_children_list(self):
         return list(self.values)
 
     def get_child_by_name(self, name):
         return self.items.get(name)
+
+
+class _WrappedWells(Sequence):
+    """
+    Read-only sequence of :wells: at :positions:, a :range: which
+    wraps around the end of :wells:
+    """
+    def __init__(self, wells, positions):
+        self.wells = wells
+        self.positions = positions
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _WrappedWells(self.wells, self.positions[index])
+        return self.wells[self.positions[index] % len(self.wells)]
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class LazyWellSeries(WellSeries):
+    """
+    :WellSeries: of :container:'s wells at :positions:, a :range:
+    wrapping around the end of the container
+
+    Only the range is stored, wells and their names are resolved
+    when accessed
+    """
+    def __init__(self, container, positions, name=None):
+        self.values = _WrappedWells(container._children_list, positions)
+        self.offset = 0
+        self.name = name
+        self._children_list = self.values
+        self._items = None
+
+    def _resolve_names(self):
+        if self._items is None:
+            names = [w.get_name() for w in self.values]
+            self._items = dict(zip(names, self.values))
+            self._index_names(names)
+
+    @property
+    def items(self):
+        self._resolve_names()
+        return self._items
+
+    def get_index_from_name(self, name):
+        self._resolve_names()
+        return super(LazyWellSeries, self).get_index_from_name(name)
+
+    def get_name_by_instance(self, well):
+        self._resolve_names()
+        return super(LazyWellSeries, self).get_name_by_instance(well)
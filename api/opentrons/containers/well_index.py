@@ -0,0 +1,163 @@
+import math
+
+from opentrons.util.vector import Vector
+
+
+class WellIndex(object):
+    """
+    Spatial index of the centers of all wells on a :Deck:
+
+    Centers are hashed into a uniform grid of :cell_size: millimeter
+    cells over the XY plane. Distances are measured in the XY plane too,
+    because the height of the head says nothing about which well it is
+    above.
+
+    If :calibrator: is given, centers are in that instrument's calibrated
+    deck coordinates (calibration of individual wells is not taken into
+    account), otherwise in deck coordinates. :Robot.well_index: keeps
+    one for the robot's deck
+    >>> index = WellIndex(robot._deck)
+    >>> index.nearest((100, 100, 0))
+    """
+
+    def __init__(self, deck, calibrator=None, cell_size=10):
+        self.deck = deck
+        self.calibrator = calibrator
+        self.cell_size = cell_size
+
+        # container -> [(well, x, y), ...]
+        self._points = {}
+        # (column, row) -> [(well, x, y), ...]
+        self._cells = {}
+        # (min column, min row, max column, max row) of occupied cells,
+        # *None* if there are none
+        self._bounds = None
+
+        for container in deck.containers().values():
+            self.add_container(container)
+
+    def _cell(self, x, y):
+        return (
+            int(math.floor(x / self.cell_size)),
+            int(math.floor(y / self.cell_size)))
+
+    def add_container(self, container):
+        """
+        Indexes wells of :container:, replacing what was indexed for it
+        before. Call it again after :container: was recalibrated
+        """
+        self.remove_container(container)
+
+        if self.calibrator:
+            origin = self.calibrator.convert(container)
+        else:
+            origin = container.coordinates(self.deck)
+        origin_x, origin_y, _ = origin
+
+        centers = container.wells_center() + (origin_x, origin_y, 0)
+        points = []
+        for well, x, y in zip(container, centers.x, centers.y):
+            point = (well, x, y)
+            self._cells.setdefault(self._cell(*point[1:]), []).append(point)
+            points.append(point)
+        self._points[container] = points
+        self._update_bounds(
+            self._cell(*point[1:]) for point in points)
+
+    def remove_container(self, container):
+        """
+        Drops wells of :container: from the index
+        """
+        points = self._points.pop(container, [])
+        for point in points:
+            cell = self._cell(*point[1:])
+            self._cells[cell].remove(point)
+            if not self._cells[cell]:
+                del self._cells[cell]
+        if points:
+            self._bounds = None
+            self._update_bounds(self._cells)
+
+    def _update_bounds(self, cells):
+        """
+        Extends :_bounds: to include :cells:
+        """
+        for column, row in cells:
+            if self._bounds is None:
+                self._bounds = (column, row, column, row)
+                continue
+            min_column, min_row, max_column, max_row = self._bounds
+            self._bounds = (
+                min(min_column, column), min(min_row, row),
+                max(max_column, column), max(max_row, row))
+
+    def _distances(self, x, y, ring):
+        """
+        Yields (distance, well) for wells in cells :ring: cells away
+        from the cell of (:x:, :y:)
+        """
+        column, row = self._cell(x, y)
+        for i in range(column - ring, column + ring + 1):
+            for j in range(row - ring, row + ring + 1):
+                if max(abs(i - column), abs(j - row)) != ring:
+                    continue
+                for well, well_x, well_y in self._cells.get((i, j), []):
+                    yield math.hypot(well_x - x, well_y - y), well
+
+    def _max_ring(self, x, y):
+        """
+        Returns how many rings away the furthest corner of occupied
+        cells is
+        """
+        if self._bounds is None:
+            return 0
+        column, row = self._cell(x, y)
+        min_column, min_row, max_column, max_row = self._bounds
+        return max(
+            column - min_column, max_column - column,
+            row - min_row, max_row - row,
+            0)
+
+    def nearest(self, coordinates, max_distance=None):
+        """
+        Returns the well closest to :coordinates:, or *None* if there is
+        no well within :max_distance:
+        """
+        x, y, _ = Vector(coordinates)
+        best_distance, best_well = None, None
+
+        max_ring = self._max_ring(x, y)
+        if max_distance is not None:
+            max_ring = min(
+                max_ring, int(math.ceil(max_distance / self.cell_size)))
+
+        for ring in range(max_ring + 1):
+            for distance, well in self._distances(x, y, ring):
+                if best_distance is None or distance < best_distance:
+                    best_distance, best_well = distance, well
+            # Wells in further rings are at least this far away
+            if best_distance is not None and \
+                    best_distance <= ring * self.cell_size:
+                break
+
+        if max_distance is not None and best_distance is not None and \
+                best_distance > max_distance:
+            return None
+        return best_well
+
+    def within(self, coordinates, radius):
+        """
+        Returns the list of wells within :radius: of :coordinates:,
+        closest first
+        """
+        x, y, _ = Vector(coordinates)
+        max_ring = min(
+            self._max_ring(x, y), int(math.ceil(radius / self.cell_size)))
+
+        res = [
+            (distance, well)
+            for ring in range(max_ring + 1)
+            for distance, well in self._distances(x, y, ring)
+            if distance <= radius
+        ]
+        return [well for _, well in sorted(res, key=lambda r: r[0])]
@@ -35,14 +35,35 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
     AXIS_AMPERAGE = 'M907'
     STEPS_PER_MM = 'M92'
 
+    WAIT_FOR_MOVES = 'M400'
+
     PUSH_SPEED = 'M120'
     POP_SPEED = 'M121'
 
     RESET = 'reset'
 
+    # Responses the board sends for every G0
+    OKS_PER_MOVE = 2
+
+    # Seconds between position polls while waiting for arrival,
+    # see _arrival_poll_interval
+    ARRIVAL_POLL_MIN = 0.01
+    ARRIVAL_POLL_MAX = 0.25
+    # Seconds to wait for M400, i.e. for the longest move to finish
+    WAIT_FOR_MOVES_TIMEOUT = 60
+
     ABSOLUTE_POSITIONING = 'G90'
     RELATIVE_POSITIONING = 'G91'
 
+    # Commands changing state of the board which later commands rely on
+    MODAL_COMMANDS = [
+        ABSOLUTE_POSITIONING, RELATIVE_POSITIONING, SET_SPEED,
+        SET_ACCELERATION, PUSH_SPEED, POP_SPEED
+    ]
+
+    # Commands moving the head or plungers, or redefining where they are
+    MOTION_COMMANDS = [MOVE, 'G1', 'G92', HOME, SET_ZERO]
+
     COMMANDS_TO_RECORD = [
         ABSOLUTE_POSITIONING, RELATIVE_POSITIONING, MOVE, DWELL, HOME,
         SET_ZERO, SET_SPEED, SET_ACCELERATION, PUSH_SPEED, POP_SPEED,
@@ -97,6 +118,33 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         self.ot_one_dimensions = {}
         self.speeds = {}
 
+        # Modal state we last set the board to (positioning mode, speeds
+        # and acceleration), so we send only changes, see _set_modal_state
+        self.modal_state = {}
+
+        # Target position of all axes (in the board's coordinates) as of
+        # the last move we sent, *None* when unknown, see _get_target
+        self.target_position = None
+        # Query the board for positions after every move, to check them
+        # against the target position we keep track of
+        self.verify_moves = False
+
+        # Set on connect if the firmware supports M400 (wait for moves
+        # to finish), to wait for arrival with it instead of polling the
+        # position. Firmware versions supporting it are listed under
+        # wait_for_moves in smoothie-defaults.ini
+        self.wait_for_moves_supported = False
+        # Positions polled by the last wait_for_arrival
+        self.arrival_polls = 0
+
+        # Streaming mode, see start_streaming
+        self.streaming = False
+        self.stream_window = 4
+        # Responses still to read for streamed moves, and whether any
+        # streamed move may still be running
+        self._pending_oks = 0
+        self._streamed_moves = False
+
         self.smoothie_player = None
 
         self._apply_defaults(defaults)
@@ -111,13 +159,19 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         return self.connection.name()
 
     def disconnect(self):
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
+        self._forget_streamed_moves()
         if self.connection:
             self.connection.close()
 
     def connect(self, smoothie_connection):
+        self.invalidate_modal_state()
         self.connection = smoothie_connection
         self.toggle_port()
         self.versions_compatible()
+        self.wait_for_moves_supported = (
+            self.firmware_version in self.wait_for_moves_firmware)
         self.prevent_squeal_on_boot()
         self.calm_down()
         log.debug("Connected to {}".format(self.connection.name()))
@@ -152,6 +206,9 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
     def toggle_port(self):
         if not self.connection:
             raise RuntimeError('Not connected to robot')
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
+        self._forget_streamed_moves()
         self.connection.close()
         self.connection.open()
         self.connection.serial_pause()
@@ -224,6 +281,16 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         return bool(self.smoothie_player.is_playing())
 
     def record_start(self, player):
+        self.synchronize()
+        # The recording is played on another board, so it has to set
+        # modal state itself instead of relying on what this one has
+        self.invalidate_modal_state()
+        # start from where the board actually is, not from what we
+        # last sent it
+        if self.is_connected():
+            self.get_target_position()
+        else:
+            self.invalidate_target_position()
         self.smoothie_player = player
         self.smoothie_player.record_start(self.COMMANDS_TO_RECORD)
 
@@ -235,9 +302,96 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
             self.smoothie_player.record(command, data)
 
     def play(self, player):
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
         self.smoothie_player = player
         self.smoothie_player.play(self.connection)
 
+    def invalidate_modal_state(self):
+        """
+        Forgets modal state of the board, it is sent again before
+        the next command relying on it
+        """
+        self.modal_state = {}
+
+    def invalidate_target_position(self):
+        """
+        Forgets the target position we keep track of, it is read from
+        the board the next time it is needed
+        """
+        self.target_position = None
+
+    def _get_target(self):
+        """
+        Returns target position of the board we keep track of,
+        querying the board only if it is unknown
+        """
+        if self.target_position is None:
+            self.get_target_position()
+        return self.target_position
+
+    def start_streaming(self, window=4):
+        """
+        Sends head moves without waiting for each of them to finish, so
+        the board plans them back to back instead of stopping in between
+
+        At most :window: moves are sent ahead of the ones the board
+        acknowledged with an ok. Plunger moves, delays, homing, mosfets
+        and position reads first wait for streamed moves to finish,
+        see :synchronize:
+        """
+        self.stream_window = max(1, int(window))
+        self.streaming = True
+
+    def stop_streaming(self):
+        """
+        Waits for streamed moves to finish and goes back to waiting
+        for every move
+        """
+        try:
+            self.synchronize()
+        finally:
+            self.streaming = False
+
+    def synchronize(self):
+        """
+        Waits for all moves sent while streaming to finish
+        """
+        if self._streamed_moves:
+            self.wait_for_arrival()
+            self._notify_move_finished(self._get_target())
+        else:
+            self._read_pending_oks()
+
+    def _read_pending_oks(self, keep=0):
+        """
+        Reads responses to streamed moves until only :keep: are left
+        """
+        while self._pending_oks > keep:
+            self._pending_oks -= 1
+            self.wait_for_ok()
+
+    def _forget_streamed_moves(self):
+        """
+        Forgets streamed moves the board dropped or will not
+        respond to, e.g. after a halt
+        """
+        self._pending_oks = 0
+        self._streamed_moves = False
+
+    def _set_modal_state(self, key, value, command, **kwargs):
+        """
+        Sends :command: which sets modal state :key: of the board
+        to :value:, unless the board already has it
+        """
+        if key in self.modal_state and self.modal_state[key] == value:
+            return
+        # Unknown until the board confirms it
+        self.modal_state.pop(key, None)
+        self._send_command(command, **kwargs)
+        self.wait_for_ok()
+        self.modal_state[key] = value
+
     # SMOOTHIE METHODS
     def send_command(self, command, read_after=True, timeout=3, **kwargs):
         """
@@ -250,22 +404,35 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         send_command(self.MOVE, x=100 y=100)
         G0 X100 Y100
         """
-
+        words = command.split()
+        if set(words).intersection(self.MODAL_COMMANDS):
+            self.invalidate_modal_state()
+        if any(word.startswith(motion)
+               for word in words for motion in self.MOTION_COMMANDS):
+            self.invalidate_target_position()
+        return self._send_command(command, read_after, timeout, **kwargs)
+
+    def _send_command(self, command, read_after=True, timeout=3, **kwargs):
         if not self.is_connected():
             self.toggle_port()
 
+        # Responses to streamed moves would be flushed with the input
+        self._read_pending_oks()
+        self.connection.flush_input()
+        self._write_command(command, **kwargs)
+
+        if read_after:
+            return self.readline_from_serial(timeout=timeout)
+
+    def _write_command(self, command, **kwargs):
         args = ' '.join(['{}{}'.format(k, v) for k, v in kwargs.items()])
         gcode_line = '{} {}\r\n'.format(command, args)
         log.debug("Write: {}".format(gcode_line))
 
-        self.connection.flush_input()
         self.connection.write_string(gcode_line)
 
         self.record(command, gcode_line)
 
-        if read_after:
-            return self.readline_from_serial(timeout=timeout)
-
     def detect_smoothie_error(self, msg):
         """
         Detect if it hit a home switch
@@ -281,10 +448,15 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
             raise RuntimeWarning(error_msg)
 
     def move(self, mode='absolute', **kwargs):
+        streamed = self.streaming and not any(ax in kwargs for ax in 'ab')
+        if not streamed:
+            self.synchronize()
+
         self.set_coordinate_system(mode)
         self.set_speed()
 
-        current = self.get_head_position()['target']
+        target = self._get_target()
+        current = self.flip_coordinates(Vector(target))
         target_point = {
             axis: kwargs.get(
                 axis,
@@ -304,16 +476,48 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         args.update({"F": max(list(self.speeds.values()))})
 
         self.check_paused_stopped()
-        self.send_command(self.MOVE, **args)
-        self.wait_for_ok()
-        self.wait_for_arrival()
-
-        arguments = {
-            'name': 'move-finished',
-            'position': {
+        # Unknown until the board confirms the move
+        self.invalidate_target_position()
+        if streamed:
+            if not self.is_connected():
+                self.toggle_port()
+            # Wait for the board to acknowledge moves
+            # until there is room in the window
+            self._read_pending_oks(
+                keep=(self.stream_window - 1) * self.OKS_PER_MOVE)
+            self._write_command(self.MOVE, **args)
+            self._pending_oks += self.OKS_PER_MOVE
+            self._streamed_moves = True
+        else:
+            self._send_command(self.MOVE, **args)
+            self.wait_for_ok()
+        for axis, value in args.items():
+            if axis == 'F':
+                continue
+            if mode == 'relative':
+                value += target.get(axis.lower(), 0)
+            target[axis.lower()] = value
+        self.target_position = target
+
+        if not streamed:
+            self.wait_for_arrival()
+            self._notify_move_finished(target)
+
+    def _notify_move_finished(self, target):
+        if self.verify_moves:
+            position = {
                 'head': self.get_head_position()["current"],
                 'plunger': self.get_plunger_positions()["current"]
-            },
+            }
+        else:
+            position = {
+                'head': self.flip_coordinates(Vector(target)),
+                'plunger': {axis: target.get(axis, 0) for axis in 'ab'}
+            }
+        arguments = {
+            'name': 'move-finished',
+            'position': position,
+            'polls': self.arrival_polls,
             'class': type(self.connection).__name__
         }
         trace.EventBroker.get_instance().notify(arguments)
@@ -334,7 +538,22 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         return coordinates
 
     def wait_for_arrival(self, tolerance=1):
-        target = self.get_target_position()
+        """
+        Waits for the board to reach the target position of the moves
+        sent so far
+
+        Uses M400 if :wait_for_moves_supported:, otherwise polls the
+        current position, less often the further and faster there is to
+        go. How many positions were polled is kept in :arrival_polls:
+        """
+        self._read_pending_oks()
+        self._streamed_moves = False
+        target = self._get_target()
+        self.arrival_polls = 0
+
+        if self.wait_for_moves_supported:
+            self._wait_for_moves()
+            return
 
         prev_diff = 0
         did_move_timestamp = time.time()
@@ -342,15 +561,17 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         while True:
             self.check_paused_stopped()
             try:
+                self.arrival_polls += 1
                 current = self.get_current_position()
                 diff = self._get_difference(current, target)
                 if diff < tolerance:
+                    log.debug('Arrived after {} poll(s)'.format(
+                        self.arrival_polls))
                     return
                 if diff != prev_diff:
                     did_move_timestamp = time.time()
                 prev_diff = diff
-                if diff > tolerance * 5:
-                    self.connection.serial_pause()
+                time.sleep(self._arrival_poll_interval(diff))
             except Exception:
                 self.connection.serial_pause()
                 self.connection.flush_input()
@@ -358,6 +579,43 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
             if time.time() - did_move_timestamp > 1.0:
                 raise RuntimeError('Expected robot to move, please reconnect')
 
+    def _wait_for_moves(self):
+        """
+        Sends M400 and waits for the board to answer it once all moves
+        are finished, checking for pause and stop between short reads
+        """
+        self.check_paused_stopped()
+        self._send_command(self.WAIT_FOR_MOVES, read_after=False)
+        end_time = time.time() + self.WAIT_FOR_MOVES_TIMEOUT
+
+        while True:
+            self.check_paused_stopped()
+            if self.halted.is_set():
+                # The board dropped its moves and will not answer
+                return
+            try:
+                self.readline_from_serial(timeout=self.ARRIVAL_POLL_MAX)
+                break
+            except RuntimeWarning:
+                if time.time() > end_time:
+                    raise RuntimeWarning(
+                        'No response to M400 after {} second(s)'.format(
+                            self.WAIT_FOR_MOVES_TIMEOUT))
+        self.wait_for_ok()
+
+    def _arrival_poll_interval(self, distance):
+        """
+        Returns seconds to wait before polling the position again, half
+        the time :distance: takes at the fastest configured speed
+        """
+        speeds = [speed for speed in self.speeds.values() if speed]
+        if not speeds:
+            return self.ARRIVAL_POLL_MIN
+        seconds_left = distance / (max(speeds) / 60)  # speeds are mm/min
+        return min(
+            max(seconds_left / 2, self.ARRIVAL_POLL_MIN),
+            self.ARRIVAL_POLL_MAX)
+
     def _get_difference(self, c, t):
         diff = {}
         for axis in list(t.keys()):
@@ -370,6 +628,7 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
 
     def home(self, *axis):
 
+        self.synchronize()
         self.calm_down()
 
         axis_to_home = ''
@@ -391,6 +650,7 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
             raise RuntimeWarning(
                 'HOMING ERROR: Check switches are being pressed and connected')
 
+        self.invalidate_target_position()
         self.prevent_squeal_after_home(axis_to_home)
 
         arguments = {
@@ -405,14 +665,15 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
 
     def set_coordinate_system(self, mode):
         if mode == 'absolute':
-            self.send_command(self.ABSOLUTE_POSITIONING)
+            command = self.ABSOLUTE_POSITIONING
         elif mode == 'relative':
-            self.send_command(self.RELATIVE_POSITIONING)
+            command = self.RELATIVE_POSITIONING
         else:
             raise ValueError('Invalid coordinate mode: ' + mode)
-        self.wait_for_ok()
+        self._set_modal_state('positioning', mode, command)
 
     def wait(self, delay_time):
+        self.synchronize()
         _simulated_time = time.time()
 
         def _current_time():
@@ -448,6 +709,9 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         })
 
     def calm_down(self):
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
+        self._forget_streamed_moves()
         self.send_command(self.CALM_DOWN, read_after=False)
         self.ignore_next_line()
         self.ignore_next_line()
@@ -455,11 +719,17 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         self.connection.flush_input()
 
     def send_halt_command(self):
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
+        self._forget_streamed_moves()
         self.send_command(self.HALT, read_after=False)
         self.connection.serial_pause()
         self.connection.flush_input()
 
     def reset(self):
+        self.invalidate_modal_state()
+        self.invalidate_target_position()
+        self._forget_streamed_moves()
         res = self.send_command(self.RESET)
         if 'Rebooting' in res:
             self.wait_for_ok()
@@ -490,16 +760,20 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         }
 
     def get_current_position(self):
+        self.synchronize()
         # ok MCS: X:0.0000 Y:0.0000 Z:0.0000 A:0.0000 B:0.0000 C:0.0000
         current_string = self.send_command(self.GET_POSITION)
         self.wait_for_ok()
         return self._parse_axis_values(current_string)
 
     def get_target_position(self):
+        self.synchronize()
         # ok MP: X:0.0000 Y:0.0000 Z:0.0000 A:0.0000 B:0.0000 C:0.0000
         target_string = self.send_command(self.GET_TARGET)
         self.wait_for_ok()
-        return self._parse_axis_values(target_string)
+        target = self._parse_axis_values(target_string)
+        self.target_position = dict(target)
+        return target
 
     def set_acceleration(self, **kwargs):
         axis = {
@@ -507,8 +781,17 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
             for ax, val in kwargs.items()
             if ax.upper() in 'XYZABC'
         }
-        self.send_command(self.SET_ACCELERATION, **axis)
-        self.wait_for_ok()
+        acceleration = dict(self.modal_state.get('acceleration', {}))
+        changed = {
+            ax: val
+            for ax, val in axis.items()
+            if ax not in acceleration or acceleration[ax] != val
+        }
+        if not changed:
+            return
+        acceleration.update(changed)
+        self._set_modal_state(
+            'acceleration', acceleration, self.SET_ACCELERATION, **changed)
 
     def set_speed(self, *args, **kwargs):
         if len(args) > 0:
@@ -519,8 +802,7 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
                 key.upper(): int(val / 60)  # M203.1 is in mm/sec (not mm/min)
                 for key, val in self.speeds.items()
             }
-            self.send_command(self.SET_SPEED, **kwargs)
-            self.wait_for_ok()
+            self._set_modal_state('speed', kwargs, self.SET_SPEED, **kwargs)
 
     def set_plunger_speed(self, rate, axis):
         if axis.lower() not in 'ab':
@@ -568,6 +850,7 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
         }
 
     def set_mosfet(self, mosfet_index, state):
+        self.synchronize()
         try:
             command = self.MOSFET[mosfet_index][bool(state)]
             res = self.send_command(command)
@@ -700,6 +983,8 @@ class SmoothieDriver_2_0_0(SmoothieDriver):
 
         self.compatible_firmware = json.loads(DEFAULT_VERSIONS['firmware'])
         self.compatible_config = json.loads(DEFAULT_VERSIONS['config'])
+        self.wait_for_moves_firmware = json.loads(
+            DEFAULT_VERSIONS.get('wait_for_moves', '[]'))
 
         for key in DEFAULT_MODELS.keys():
             axis_size = Vector(DEFAULT_MODELS[key]['dimensions'])
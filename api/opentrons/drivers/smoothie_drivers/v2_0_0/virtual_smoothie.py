@@ -270,6 +270,9 @@ class VirtualSmoothie_2_0_0(VirtualSmoothie):
     def process_dwell_command(self, arguments):
         return 'ok\nok'
 
+    def process_wait_for_moves(self, arguments):
+        return 'ok\nok'
+
     def process_nop(self, arguments):
         return 'ok\nok'
 
@@ -295,6 +298,7 @@ class VirtualSmoothie_2_0_0(VirtualSmoothie):
             'M': self.process_nop,
             'G0': self.process_move_command,
             'G4': self.process_dwell_command,
+            'M400': self.process_wait_for_moves,
             'M114.2': self.process_get_position,
             'M114.4': self.process_get_target,
             'M203.1': self.process_speed,
@@ -2,7 +2,7 @@ import functools
 import json
 import numbers
 
-from opentrons.util.vector import Vector
+from opentrons.util.vector import Vector, VectorArray
 
 
 def is_number(obj):
@@ -29,9 +29,15 @@ def unpack_coordinates(coordinates):
 
 
 def flip_coordinates(coordinates, dimensions):
+    x_size, y_size, z_size = unpack_coordinates(dimensions)
+    if isinstance(coordinates, VectorArray):
+        return VectorArray(
+            coordinates.x,
+            [y_size - y for y in coordinates.y],
+            [z_size - z for z in coordinates.z])
+
     coordinates = unpack_coordinates(coordinates)
     x, y, z = coordinates
-    x_size, y_size, z_size = unpack_coordinates(dimensions)
     return (x, y_size - y, z_size - z)
 
 
@@ -70,6 +76,8 @@ def break_down_travel(p1, target, increment=5, mode='absolute'):
 
 def import_calibration_json(json_string, robot, calibrated_top=False):
     pipette_calibration = json.loads(json_string)
+    containers = robot._deck.containers()
+    dimensions = robot._driver.get_dimensions()
 
     for axis, data in pipette_calibration.items():
 
@@ -81,13 +89,17 @@ def import_calibration_json(json_string, robot, calibrated_top=False):
             pipette.positions['blow_out'] = data['blowout']
             pipette.positions['drop_tip'] = data['droptip']
 
+            positions = []
             container_data = data['theContainers']
             for name, coordinates in container_data.items():
-                children = robot._deck.get_all_children()
-                container = list(
-                    filter(
-                        lambda child: child.get_name() == name,
-                        children))[0]
+                # If calibration data is null for x, y, z then skip this
+                # container
+                if not all([coordinates[c] for c in 'xyz']):
+                    continue
+                container = containers.get(name)
+                if container is None:
+                    raise ValueError(
+                        'Container "{}" is not on deck'.format(name))
                 z_pos = -1
                 if calibrated_top:
                     if (
@@ -102,13 +114,10 @@ def import_calibration_json(json_string, robot, calibrated_top=False):
                         y=0,
                         z=z_pos,
                         reference=container))
-                # If calibration data is null for x, y, z then skip this
-                # container
-                if not all([coordinates[c] for c in 'xyz']):
-                    continue
-                pipette.calibrate_position(
-                    location,
-                    robot.flip_coordinates(coordinates))
+                positions.append(
+                    (location, flip_coordinates(coordinates, dimensions)))
+
+            pipette.calibrate_positions(positions)
 
 
 def import_calibration_file(file_name, robot):
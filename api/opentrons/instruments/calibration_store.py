@@ -0,0 +1,235 @@
+import copy
+import json
+import os
+import threading
+
+from opentrons.util.files import atomic_write
+from opentrons.util.log import get_logger
+from opentrons.util.vector import (
+    Vector, TaggedVectorEncoder, decode_tagged_vector)
+
+
+log = get_logger(__name__)
+
+
+class CalibrationStore(object):
+    """
+    Calibration records of instruments by key, cached in memory
+
+    Records are persisted to :file_path:, a JSON snapshot of all of them:
+    {"version": 2, "data": {key: record, ...}}
+
+    :Vector:s in records are stored as {"__vector__": [x, y, z]}, see
+    :TaggedVectorEncoder:, and restored while the JSON is parsed.
+    Version 1 files stored them as JSON strings, they are converted
+    the first time such a file is loaded
+
+    Saving a record appends just that record to a journal next to the
+    snapshot (:file_path: + '.journal'), one JSON line per save. Once the
+    journal grows past :max_journal_entries:, and whenever the store is
+    loaded from disk, the journal is folded into the snapshot, which is
+    replaced atomically.
+
+    Records are dicts of JSON-serializable values and :Vector:s, the
+    store hands out and keeps copies of them
+    """
+
+    version = 2
+
+    def __init__(self, file_path, max_journal_entries=50):
+        self.file_path = file_path
+        self.journal_path = file_path + '.journal'
+        self.max_journal_entries = max_journal_entries
+
+        self._lock = threading.RLock()
+        self._records = None
+        self._journal_entries = 0
+        # (snapshot stat, journal stat) when we last read or wrote them,
+        # to notice other processes writing to the store
+        self._stats = None
+
+    def get(self, key):
+        """
+        Returns a copy of the record saved under :key:, or *None*
+        """
+        with self._lock:
+            return copy.deepcopy(self._load().get(key))
+
+    def get_all(self):
+        """
+        Returns a copy of all records by key
+        """
+        with self._lock:
+            return copy.deepcopy(self._load())
+
+    def put(self, key, record):
+        """
+        Saves :record: under :key:, appending it to the journal
+        """
+        with self._lock:
+            records = self._load()
+            records[key] = copy.deepcopy(record)
+
+            entry = json.dumps({
+                'version': self.version,
+                'key': key,
+                'record': record
+            }, cls=TaggedVectorEncoder)
+            with open(self.journal_path, 'a') as f:
+                f.write(entry + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += 1
+
+            if self._journal_entries > self.max_journal_entries:
+                self.compact()
+            else:
+                self._stats = self._stat()
+
+    def compact(self):
+        """
+        Folds the journal into the snapshot
+        """
+        with self._lock:
+            self._load()
+            self._write_snapshot()
+
+    def reset(self):
+        """
+        Replaces the store with a blank one
+        """
+        with self._lock:
+            self._records = {}
+            self._write_snapshot()
+
+    def _write_snapshot(self):
+        atomic_write(self.file_path, json.dumps({
+            'version': self.version,
+            'data': self._records
+        }, indent=4, cls=TaggedVectorEncoder))
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_entries = 0
+        self._stats = self._stat()
+
+    def delete(self):
+        """
+        Deletes the snapshot and the journal
+        """
+        with self._lock:
+            for path in (self.file_path, self.journal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._records = None
+            self._stats = None
+
+    def _stat(self):
+        def stat(path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            return st.st_mtime_ns, st.st_size, st.st_ino
+
+        return stat(self.file_path), stat(self.journal_path)
+
+    def _load(self):
+        """
+        Returns cached records, reading them from disk if the files
+        changed since we last touched them
+        """
+        if self._records is not None and self._stats == self._stat():
+            return self._records
+
+        version, records = self._read_snapshot()
+        self._records = records or {}
+        self._journal_entries = 0
+        self._replay_journal()
+
+        if records is None or version != self.version or \
+                os.path.exists(self.journal_path):
+            self._write_snapshot()
+        else:
+            self._stats = self._stat()
+        return self._records
+
+    def _read_snapshot(self):
+        """
+        Returns (version, records) of the snapshot, records converted to
+        the current version, or (None, None) if it is missing or not valid
+        """
+        try:
+            with open(self.file_path) as f:
+                snapshot = json.load(f, object_hook=decode_tagged_vector)
+        except FileNotFoundError:
+            return None, None
+        except ValueError as e:
+            log.error(
+                'Error parsing calibration data (file: {}): {}'.format(
+                    self.file_path, e))
+            return None, None
+
+        if not isinstance(snapshot, dict) or \
+                set(snapshot.keys()) != {'version', 'data'} or \
+                not snapshot['version'] or \
+                not isinstance(snapshot['data'], dict):
+            return None, None
+
+        version = snapshot['version']
+        records = snapshot['data']
+        if version == 1:
+            records = decode_legacy_vectors(records)
+        return version, records
+
+    def _replay_journal(self):
+        try:
+            with open(self.journal_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                entry = json.loads(line, object_hook=decode_tagged_vector)
+                record = entry['record']
+                if entry.get('version', 1) == 1:
+                    record = decode_legacy_vectors(record)
+                self._records[entry['key']] = record
+                self._journal_entries += 1
+            except (ValueError, KeyError, TypeError):
+                # A save interrupted half way through the last line
+                log.error(
+                    'Skipping damaged calibration journal entry '
+                    '(file: {}): {!r}'.format(self.journal_path, line))
+
+
+def decode_legacy_vectors(obj):
+    """
+    Restores :Vector:s which version 1 files stored as JSON strings
+    anywhere in the document, so every string has to be tried
+    """
+    for key, val in obj.items():
+        if isinstance(val, dict):
+            decode_legacy_vectors(val)
+        elif isinstance(val, str):
+            try:
+                decoded = json.loads(val)
+            except ValueError:
+                continue
+            if isinstance(decoded, dict):
+                obj[key] = Vector(decoded)
+    return obj
+
+
+_stores = {}
+
+
+def get_calibration_store(file_path):
+    """
+    Returns the :CalibrationStore: of :file_path:, shared by everyone
+    in the process so records are parsed once
+    """
+    store = _stores.get(file_path)
+    if store is None:
+        store = _stores.setdefault(file_path, CalibrationStore(file_path))
+    return store
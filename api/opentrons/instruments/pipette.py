@@ -2,7 +2,7 @@ import copy
 import itertools
 
 from opentrons.containers import unpack_location
-from opentrons.containers.calibrator import Calibrator
+from opentrons.containers.calibrator import Calibrator, CalibrationSnapshot
 from opentrons.containers.placeable import (
     Container, humanize_location, Placeable, WellSeries
 )
@@ -1205,6 +1205,75 @@ class Pipette(Instrument):
 
         return self
 
+    def calibrate_positions(self, positions):
+        """
+        Save the positions of many :any:`Placeable` at once, calibration
+        data is persisted just once (see :any:`calibrate_position`)
+
+        Parameters
+        ----------
+        positions : list of tuple(location, :any:`Vector`)
+            Pairs of location (see :any:`calibrate_position`)
+            and the coordinate to save it to
+
+        Returns
+        -------
+
+        This instance of :class:`Pipette`.
+        """
+        self.calibration_data = self.calibrator.calibrate_all(
+            self.calibration_data,
+            positions)
+
+        self.update_calibrations()
+
+        return self
+
+    def calibration_snapshot(self):
+        """
+        Returns the current calibration of this pipette as a
+        :any:`CalibrationSnapshot`, to branch from or switch back to
+
+        Snapshots share unchanged data with each other, so they are
+        cheap to keep (see :any:`use_calibration_snapshot`)
+        """
+        return CalibrationSnapshot(self.calibration_data)
+
+    def use_calibration_snapshot(self, snapshot):
+        """
+        Switch this pipette to the calibration of :any:`CalibrationSnapshot`,
+        e.g. to simulate a protocol with other calibrations
+
+        Notes
+        -----
+        Calibration saved to disk is left as it is, call
+        `update_calibrations` to persist the snapshot.
+
+        Returns
+        -------
+
+        This instance of :class:`Pipette`.
+
+        Examples
+        --------
+        ..
+        >>> from opentrons import robot, containers, instruments
+        >>> from opentrons.util.vector import Vector
+        >>> robot.reset() # doctest: +ELLIPSIS
+        <opentrons.robot.robot.Robot object at ...>
+        >>> plate = containers.load('96-flat', 'B1')
+        >>> p200 = instruments.Pipette(axis='b')
+        >>> base = p200.calibration_snapshot()
+        >>> what_if = base.with_delta(plate.get_path(), Vector(0, 0, 2))
+        >>> p200.use_calibration_snapshot(what_if) # doctest: +ELLIPSIS
+        <opentrons.instruments.pipette.Pipette object at ...>
+        >>> p200.use_calibration_snapshot(base) # doctest: +ELLIPSIS
+        <opentrons.instruments.pipette.Pipette object at ...>
+        """
+        self.calibration_data = self.calibrator.use_calibration(
+            snapshot.data)
+        return self
+
     def set_max_volume(self, max_volume):
         """
         Set this pipette's maximum volume, equal to the number of
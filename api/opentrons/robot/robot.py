@@ -200,6 +200,7 @@ class Robot(object):
 
         self._deck = containers.Deck()
         self.setup_deck()
+        self._well_index = None
 
         self._ingredients = {}  # TODO needs to be discusses/researched
         self._instruments = {}
@@ -437,7 +438,8 @@ class Robot(object):
 
         strategy : {'arc', 'direct'}
             ``arc`` : move to the point using arc trajectory
-            avoiding obstacles.
+            avoiding obstacles. Legs of the arc are streamed to the
+            board, so the head does not stop in between them.
 
             ``direct`` : move to the point in a straight line.
 
@@ -464,8 +466,18 @@ class Robot(object):
 
         if strategy == 'arc':
             arc_coords = self._create_arc(coordinates, placeable, instrument)
-            for coord in arc_coords:
-                self._driver.move_head(**coord)
+            stream = hasattr(self._driver, 'start_streaming')
+            if stream and self._driver.streaming:
+                # whoever started streaming stops it
+                stream = False
+            if stream:
+                self._driver.start_streaming()
+            try:
+                for coord in arc_coords:
+                    self._driver.move_head(**coord)
+            finally:
+                if stream:
+                    self._driver.stop_streaming()
         elif strategy == 'direct':
             self._driver.move_head(
                 x=coordinates[0],
@@ -486,32 +498,16 @@ class Robot(object):
                 return container.max_dimensions(self._deck)
             return self._deck.max_dimensions(self._deck)
 
-        def _max_per_instrument(placeable, inst):
-            """
-            Returns list of Vectors, one for each Instrument's farthest
-            calibrated coordinate for the supplied placeable
-            """
-            if inst:
-                return [
-                    instrument.calibrator.convert(
-                        placeable,
-                        placeable.max_dimensions(placeable)
-                    )
-                ]
-            return [
-                instrument.calibrator.convert(
-                    placeable,
-                    placeable.max_dimensions(placeable)
-                )
-                for instrument in self._instruments.values()
-            ]
+        # Each instrument's Calibrator keeps calibrated bounding boxes of
+        # the containers on deck, as well as the furthermost of them all
+        instruments = [instrument]
+        if not instrument:
+            instruments = self._instruments.values()
 
-        container_max_coords = []
-        if container:
-            container_max_coords = _max_per_instrument(container, instrument)
-        else:
-            for c in self.containers().values():
-                container_max_coords += _max_per_instrument(c, instrument)
+        container_max_coords = [
+            inst.calibrator.max_dimensions(container)
+            for inst in instruments
+        ]
 
         max_coords = [
             max(
@@ -596,6 +592,9 @@ class Robot(object):
                     ax.upper(): val
                     for ax, val in self._driver.get_current_position().items()
                 })
+                # the board was moved behind the driver's back
+                d.invalidate_target_position()
+                d.invalidate_modal_state()
 
         self._driver = d
         if self._driver and not self._driver.is_connected():
@@ -706,13 +705,42 @@ class Robot(object):
         container.properties['type'] = container_name
         self._deck[slot].add(container, label)
 
+        if self._well_index:
+            self._well_index.add_container(container)
+
         # if a container is added to Deck AFTER a Pipette, the Pipette's
-        # Calibrator must update to include all children of Deck
+        # Calibrator must apply it's calibration to the container
         for _, instr in self.get_instruments():
-            if hasattr(instr, 'update_calibrator'):
-                instr.update_calibrator()
+            if hasattr(instr, 'calibrator'):
+                instr.calibrator.add_container(container)
         return container
 
+    def well_index(self, instrument=None):
+        """
+        Returns :class:`WellIndex` of all wells on the deck, to find wells
+        nearest to or around a head position.
+
+        Parameters
+        ----------
+        instrument :
+            Index wells in this instrument's calibrated coordinates.
+            If ``None``, index them in deck coordinates.
+
+        Examples
+        --------
+        >>> from opentrons import robot
+        >>> robot.reset() # doctest: +ELLIPSIS
+        <opentrons.robot.robot.Robot object at ...>
+        >>> plate = robot.add_container('96-flat', 'A1', 'plate')
+        >>> robot.well_index().nearest((25, 25, 0))
+        <Deck><Slot A1><Container plate><Well A1>
+        """
+        if instrument:
+            return instrument.calibrator.well_index()
+        if self._well_index is None:
+            self._well_index = containers.WellIndex(self._deck)
+        return self._well_index
+
     def clear_commands(self):
         """
         Clear Robot's command queue.
@@ -40,9 +40,13 @@ def refresh():
         'LOG_DIR': os.path.join(APP_DATA_DIR, 'logs'),
         'LOG_FILE': os.path.join(APP_DATA_DIR, 'logs', 'api.log'),
         'CONTAINERS_DIR': os.path.join(APP_DATA_DIR, 'containers'),
+        'CONTAINERS_CACHE_DIR':
+            os.path.join(APP_DATA_DIR, 'containers', '.cache'),
         'CONTAINERS_FILE':
             os.path.join(
                 APP_DATA_DIR, 'containers', '_containers_create.json'),
+        'CUSTOM_CONTAINERS_DIR':
+            os.path.join(APP_DATA_DIR, 'containers', 'custom'),
         'CALIBRATIONS_DIR': os.path.join(APP_DATA_DIR, 'calibrations'),
         'CALIBRATIONS_FILE':
             os.path.join(APP_DATA_DIR, 'calibrations', 'calibrations.json'),
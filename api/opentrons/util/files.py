@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+
+def atomic_write(file_path, data):
+    """
+    Replaces :file_path: with :data: (str or bytes) so that readers see
+    either the old or the new content, even if we crash mid-write
+
+    Data goes to a temporary file in the same directory, which is
+    flushed to disk and renamed over :file_path:
+    """
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path) or '.',
+        prefix='.' + os.path.basename(file_path),
+        suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
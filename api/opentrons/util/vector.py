@@ -1,11 +1,13 @@
 import math
+import operator as _operator
 
 import json
 
-
+from array import array
 from builtins import property as _property, tuple as _tuple
 from operator import itemgetter as _itemgetter
 from collections import OrderedDict
+from itertools import repeat
 
 
 class VectorValue(tuple):
@@ -77,7 +79,33 @@ class VectorEncoder(json.JSONEncoder):
             return str(obj)
 
 
+class TaggedVectorEncoder(json.JSONEncoder):
+    """
+    Encodes :Vector:s as {"__vector__": [x, y, z]},
+    decode them with :decode_tagged_vector:
+    """
+    def default(self, obj):
+        if isinstance(obj, Vector):
+            return {'__vector__': [obj.x, obj.y, obj.z]}
+        return json.JSONEncoder.default(self, obj)
+
+
+def decode_tagged_vector(obj):
+    """
+    object_hook for :json.load: restoring :Vector:s encoded by
+    :TaggedVectorEncoder:
+    """
+    if len(obj) == 1 and '__vector__' in obj:
+        return Vector(obj['__vector__'])
+    return obj
+
+
 class Vector(object):
+    """
+    Immutable (x, y, z) point
+    """
+    __slots__ = ('x', 'y', 'z')
+
     zero_vector = None
 
     @classmethod
@@ -102,6 +130,10 @@ class Vector(object):
             iterable[1],
             iterable[2])
 
+    @property
+    def coordinates(self):
+        return value_type(self.x, self.y, self.z)
+
     def to_iterable(self):
         return self.coordinates
 
@@ -113,38 +145,47 @@ class Vector(object):
 
     def length(self):
         return math.sqrt(
-            pow(self.coordinates.x, 2) +
-            pow(self.coordinates.y, 2) +
-            pow(self.coordinates.z, 2)
+            pow(self.x, 2) +
+            pow(self.y, 2) +
+            pow(self.z, 2)
         )
 
     def __init__(self, *args, **kwargs):
-        # self.coordinates = self.zero_coordinates()
-
         args_len = len(args)
-        if args_len == 1:
+        if args_len == 3:
+            x, y, z = args
+        elif args_len == 1:
             arg = args[0]
-            if isinstance(arg, dict):
-                self.coordinates = Vector.coordinates_from_dict(arg)
-            elif isinstance(arg, Vector):
-                self.coordinates = arg.coordinates
+            if isinstance(arg, Vector):
+                x, y, z = arg.x, arg.y, arg.z
+            elif isinstance(arg, dict):
+                x, y, z = Vector.coordinates_from_dict(arg)
             elif self.is_iterable(arg):
-                self.coordinates = Vector.coordinates_from_iterable(arg)
+                x, y, z = arg[0], arg[1], arg[2]
             else:
                 raise ValueError(
                     ("One argument supplied "
                      "expected to be dict or iterable, received {}")
                     .format(type(arg)))
-        elif args_len == 3:
-            self.coordinates = value_type(*args)
         else:
             raise ValueError("Expected either a dict/iterable or x, y, z")
 
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_z(self, z)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Vector is immutable')
+
+    def __reduce__(self):
+        return (Vector, (self.x, self.y, self.z))
+
     def __eq__(self, other):
         if isinstance(other, Vector):
-            return all(
-                [isclose(a, b, rel_tol=1e-5)
-                 for a, b in zip(self, other)]
+            return (
+                abs(self.x - other.x) < 1e-5 and
+                abs(self.y - other.y) < 1e-5 and
+                abs(self.z - other.z) < 1e-5
             )
         elif isinstance(other, dict):
             return self == Vector(other)
@@ -153,40 +194,48 @@ class Vector(object):
         else:
             raise ValueError("Expected operand to be dict, iterable or vector")
 
+    # Defining __eq__ used to leave Vector unhashable, keep it that way
+    __hash__ = None
+
     def __add__(self, other):
-        other = other
-        return Vector(
-            self.coordinates.x + other[0],
-            self.coordinates.y + other[1],
-            self.coordinates.z + other[2]
+        if isinstance(other, VectorArray):
+            return other + self
+        return _new_vector(
+            self.x + other[0],
+            self.y + other[1],
+            self.z + other[2]
         )
 
     def __sub__(self, other):
-        other = other
-        return Vector(
-            [a - b for a, b in zip(self, other)])
+        if isinstance(other, VectorArray):
+            return (other * -1.0) + self
+        return _new_vector(
+            self.x - other[0],
+            self.y - other[1],
+            self.z - other[2]
+        )
 
     def __truediv__(self, other):
         if isinstance(other, Vector):
-            return Vector(
-                [a / b for a, b in zip(self, other)])
+            return _new_vector(
+                self.x / other.x, self.y / other.y, self.z / other.z)
 
         scalar = float(other)
-        return self / Vector(scalar, scalar, scalar)
+        return _new_vector(self.x / scalar, self.y / scalar, self.z / scalar)
 
     def __mul__(self, other):
         if isinstance(other, Vector):
-            return Vector(
-                [a * b for a, b in zip(self, other)])
+            return _new_vector(
+                self.x * other.x, self.y * other.y, self.z * other.z)
 
         scalar = float(other)
-        return self * Vector(scalar, scalar, scalar)
+        return _new_vector(self.x * scalar, self.y * scalar, self.z * scalar)
 
     def __str__(self):
         return "(x={:.2f}, y={:.2f}, z={:.2f})".format(
-            self.coordinates.x,
-            self.coordinates.y,
-            self.coordinates.z,
+            self.x,
+            self.y,
+            self.z,
         )
 
     def __repr__(self):
@@ -195,7 +244,7 @@ class Vector(object):
     def __getitem__(self, index):
         res = None
         if isinstance(index, int):
-            res = self.coordinates[index]
+            res = (self.x, self.y, self.z)[index]
         elif isinstance(index, str):
             res = getattr(self.coordinates, index)
         elif isinstance(index, slice):
@@ -206,4 +255,118 @@ class Vector(object):
         return res
 
     def __iter__(self):
-        return iter(self.to_tuple())
+        return iter((self.x, self.y, self.z))
+
+
+_set_x = Vector.x.__set__
+_set_y = Vector.y.__set__
+_set_z = Vector.z.__set__
+
+
+def _new_vector(x, y, z):
+    """
+    Creates a :Vector: from x, y, z skipping argument parsing
+    """
+    vector = object.__new__(Vector)
+    _set_x(vector, x)
+    _set_y(vector, y)
+    _set_z(vector, z)
+    return vector
+
+
+class VectorArray(object):
+    """
+    Many (x, y, z) points stored as :x:, :y: and :z: columns of floats,
+    with the arithmetic of :Vector: applied to all of them at once
+
+    The other operand can be a single :Vector: (or any x, y, z iterable),
+    applied to every point, or a :VectorArray: of the same length
+    >>> centers = plate.wells_center(reference=deck)
+    >>> centers + (0, 0, 10)
+    """
+    def __init__(self, x=(), y=(), z=()):
+        self.x = array('d', x)
+        self.y = array('d', y)
+        self.z = array('d', z)
+        if not len(self.x) == len(self.y) == len(self.z):
+            raise ValueError('Expected x, y and z of the same length')
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """
+        Creates :VectorArray: from an iterable of :Vector:s or tuples
+        """
+        vectors = [Vector(v) for v in vectors]
+        return cls(
+            [v.x for v in vectors],
+            [v.y for v in vectors],
+            [v.z for v in vectors])
+
+    def _columns(self, other):
+        """
+        Returns x, y, z columns of :other:, or repeated :other: if
+        it is a single point
+        """
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    'Expected {} points, got {}'.format(len(self), len(other)))
+            return other.x, other.y, other.z
+        x, y, z = Vector(other)
+        count = len(self)
+        return repeat(x, count), repeat(y, count), repeat(z, count)
+
+    def _apply(self, other, operator):
+        ox, oy, oz = self._columns(other)
+        return VectorArray(
+            map(operator, self.x, ox),
+            map(operator, self.y, oy),
+            map(operator, self.z, oz))
+
+    def __add__(self, other):
+        return self._apply(other, _operator.add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._apply(other, _operator.sub)
+
+    def __mul__(self, other):
+        if not isinstance(other, (Vector, VectorArray)):
+            other = (other, other, other)
+        return self._apply(other, _operator.mul)
+
+    def __truediv__(self, other):
+        if not isinstance(other, (Vector, VectorArray)):
+            other = (other, other, other)
+        return self._apply(other, _operator.truediv)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray(self.x[index], self.y[index], self.z[index])
+        return _new_vector(self.x[index], self.y[index], self.z[index])
+
+    def __iter__(self):
+        return map(_new_vector, self.x, self.y, self.z)
+
+    def __eq__(self, other):
+        other = list(other)
+        return len(other) == len(self) and all(
+            [a == b for a, b in zip(self, other)])
+
+    __hash__ = None
+
+    def __str__(self):
+        return '[{}]'.format(', '.join([str(v) for v in self]))
+
+    def __repr__(self):
+        return str(self)
+
+    def to_list(self):
+        """
+        Returns the list of :Vector:s
+        """
+        return list(self)
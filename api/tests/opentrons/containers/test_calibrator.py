@@ -1,6 +1,6 @@
 import unittest
 
-from opentrons.containers.calibrator import Calibrator
+from opentrons.containers.calibrator import Calibrator, CalibrationSnapshot
 from opentrons.containers.placeable import (
     Container,
     Well,
@@ -128,3 +128,168 @@ class CalibratorTestCase(unittest.TestCase):
         self.assertEqual(
             my_calibrator.convert(red) + red.center(),
             current_position)
+
+    def test_calibrate_shares_calibration_data(self):
+        deck = self.generate_deck()
+        calibration_data = {
+            'A1': {'children': {'tube_rack': {'delta': (1, 1, 1)}}},
+            'B1': {'children': {'plate': {'delta': (2, 2, 2)}}}
+        }
+        my_calibrator = Calibrator(deck, calibration_data)
+
+        tube_rack = deck['A1']['tube_rack']
+        new_calibration_data = my_calibrator.calibrate(
+            calibration_data,
+            (tube_rack, (0, 0, 0)),
+            (5, 10, 0))
+
+        # Calibrated path is copied, the rest is shared
+        self.assertEqual(
+            calibration_data['A1']['children']['tube_rack']['delta'],
+            (1, 1, 1))
+        self.assertEqual(
+            new_calibration_data['A1']['children']['tube_rack']['delta'],
+            (0, 0, 0))
+        self.assertIs(new_calibration_data['B1'], calibration_data['B1'])
+
+    def test_calibration_snapshots(self):
+        deck = self.generate_deck()
+        base = CalibrationSnapshot({
+            'A1': {'children': {'tube_rack': {'delta': (1, 1, 1)}}}
+        })
+        tube_rack = deck['A1']['tube_rack']
+        red = tube_rack['Red']
+
+        what_if = base.with_delta(['A1', 'tube_rack', 'Red'], (0, 0, 5))
+        what_if = what_if.with_delta(['A1'], (1, 0, 0), 'Slot')
+        self.assertEqual(base.get(['A1', 'tube_rack', 'Red']), None)
+        self.assertEqual(
+            what_if.get(['A1', 'tube_rack', 'Red']), {'delta': (0, 0, 5)})
+        self.assertEqual(base.diff(what_if), {
+            ('A1',): (None, (1, 0, 0)),
+            ('A1', 'tube_rack', 'Red'): (None, (0, 0, 5))
+        })
+        self.assertEqual(base.diff(base.with_delta(['B1'], (0, 0, 0))), {
+            ('B1',): (None, (0, 0, 0))
+        })
+
+        my_calibrator = Calibrator(deck, base.data)
+        self.assertEqual(my_calibrator.convert(red), (11, 16, 1))
+
+        my_calibrator.use_calibration(what_if.data)
+        self.assertEqual(my_calibrator.calibration_data, what_if.data)
+        self.assertEqual(my_calibrator.convert(red), (12, 16, 6))
+        self.assertEqual(
+            my_calibrator.container_offsets[tube_rack], (7, 11, 1))
+
+        my_calibrator.use_calibration(base.data)
+        self.assertEqual(my_calibrator.convert(red), (11, 16, 1))
+        self.assertEqual(
+            my_calibrator.container_offsets[tube_rack], (6, 11, 1))
+
+    def test_calibrate_invalidates_convert(self):
+        deck = self.generate_deck()
+        my_calibrator = Calibrator(deck, {})
+
+        tube_rack = deck['A1']['tube_rack']
+        red = tube_rack['Red']
+        self.assertEqual(my_calibrator.convert(red), (10, 15, 0))
+
+        my_calibrator.calibrate(
+            {},
+            (tube_rack, red.center(tube_rack)),
+            (16, 21, 1))
+        self.assertEqual(my_calibrator.convert(red), (11, 16, 1))
+
+    def test_max_dimensions(self):
+        deck = self.generate_deck()
+        my_calibrator = Calibrator(deck, {})
+
+        tube_rack = deck['A1']['tube_rack']
+        self.assertEqual(my_calibrator.max_dimensions(), (30, 25, 0))
+        self.assertEqual(
+            my_calibrator.max_dimensions(tube_rack), (30, 25, 0))
+
+        my_calibrator.calibrate(
+            {},
+            (tube_rack, (0, 0, 0)),
+            (6, 11, 5))
+        self.assertEqual(my_calibrator.max_dimensions(), (31, 26, 5))
+        self.assertEqual(
+            my_calibrator.max_dimensions(tube_rack), (31, 26, 5))
+
+    def test_convert_all(self):
+        deck = self.generate_deck()
+        my_calibrator = Calibrator(deck, {})
+
+        tube_rack = deck['A1']['tube_rack']
+        self.assertEqual(
+            list(my_calibrator.convert_all(
+                tube_rack, tube_rack.wells_top())),
+            [my_calibrator.convert(well, well.top()[1]) for well in tube_rack])
+
+        my_calibrator.calibrate(
+            {},
+            (tube_rack, (0, 0, 0)),
+            (6, 11, 5))
+        self.assertEqual(
+            list(my_calibrator.convert_all(
+                tube_rack, tube_rack.wells_center())),
+            [my_calibrator.convert(well, well.center())
+             for well in tube_rack])
+
+    def test_add_remove_container(self):
+        deck = self.generate_deck()
+        calibration_data = {
+            'A1': {
+                'type': 'Slot',
+                'delta': (1, 1, 1),
+                'children': {
+                    'plate': {
+                        'type': 'plate',
+                        'delta': (1, 2, 3),
+                        'children': {
+                            'A1': {'type': 'Well', 'delta': (1, 1, 1)}
+                        }
+                    }
+                }
+            }
+        }
+        my_calibrator = Calibrator(deck, calibration_data)
+        tube_rack = deck['A1']['tube_rack']
+        self.assertEqual(
+            my_calibrator.container_offsets, {tube_rack: (6, 11, 1)})
+
+        plate = Container()
+        plate.add(Well(properties={'radius': 5}), 'A1', (5, 5, 0))
+        plate.add(Well(properties={'radius': 5}), 'A2', (15, 5, 0))
+        deck['A1'].add(plate, 'plate', (0, 20, 0))
+        self.assertEqual(my_calibrator.convert(plate['A2']), (21, 36, 1))
+
+        my_calibrator.add_container(plate)
+        self.assertEqual(my_calibrator.container_offsets[plate], (7, 33, 4))
+        self.assertEqual(my_calibrator.convert(plate['A1']), (13, 39, 5))
+        self.assertEqual(my_calibrator.convert(plate['A2']), (22, 38, 4))
+        self.assertEqual(
+            my_calibrator.max_dimensions(),
+            my_calibrator.max_dimensions(plate))
+
+        my_calibrator.calibrate(
+            calibration_data,
+            (deck['A1'], (0, 0, 0)),
+            (5, 10, 0))
+        self.assertEqual(my_calibrator.container_offsets[plate], (6, 32, 3))
+        self.assertEqual(my_calibrator.convert(plate['A1']), (12, 38, 4))
+        self.assertEqual(
+            my_calibrator.convert(tube_rack['Red']), (10, 15, 0))
+
+        my_calibrator.max_dimensions(plate)
+        deck['A1'].remove_child('plate')
+        other_plate = Container()
+        other_plate.add(Well(properties={'radius': 5}), 'A1', (5, 5, 0))
+        deck['A1'].add(other_plate, 'other_plate', (0, 40, 0))
+        my_calibrator.add_container(other_plate)
+        self.assertNotIn(plate, my_calibrator.container_offsets)
+        self.assertNotIn(plate, my_calibrator._max_dimensions)
+        self.assertIn(tube_rack, my_calibrator.container_offsets)
+        self.assertEqual(my_calibrator.convert(plate['A1']), (10, 35, 0))
@@ -6,7 +6,9 @@ import unittest
 from opentrons.containers import (
     create as containers_create,
     load as containers_load,
-    list as containers_list
+    list as containers_list,
+    get_custom_container_path,
+    persisted_containers
 )
 from opentrons.util import environment
 from opentrons import Robot
@@ -59,15 +61,45 @@ class ContainerTestCase(unittest.TestCase):
         for i, w in enumerate(p):
             self.assertEquals(w, p[i])
 
-        # remove the file if we only created it for this test
-        should_delete = False
-        with open(environment.get_path('CONTAINERS_FILE')) as f:
+        # each container is saved to it's own file
+        file_path = get_custom_container_path(container_name)
+        with open(file_path) as f:
             created_containers = json.load(f)
-            del created_containers['containers'][p.get_name()]
-            if not len(created_containers['containers'].keys()):
-                should_delete = True
-        if should_delete:
-            os.remove(environment.get_path('CONTAINERS_FILE'))
+        self.assertEqual(
+            list(created_containers['containers']), [container_name])
+        os.remove(file_path)
+
+    def test_containers_create_replaces_legacy(self):
+        container_name = 'plate_for_testing_legacy_containers_file'
+        legacy_path = environment.get_path('CONTAINERS_FILE')
+        self.assertFalse(os.path.exists(legacy_path))
+        with open(legacy_path, 'w') as f:
+            json.dump({'containers': {
+                container_name: {'locations': {}},
+                'other-legacy-container': {'locations': {}}
+            }}, f)
+
+        try:
+            containers_create(
+                name=container_name,
+                grid=(1, 2),
+                spacing=(9, 9),
+                diameter=4,
+                depth=8)
+            with open(legacy_path) as f:
+                self.assertEqual(
+                    list(json.load(f)['containers']),
+                    ['other-legacy-container'])
+            self.assertEqual(len(containers_load(
+                self.robot, container_name, 'A1')), 2)
+            self.assertEqual(
+                persisted_containers.persisted_containers_dict.get_file(
+                    container_name),
+                get_custom_container_path(container_name))
+        finally:
+            os.remove(legacy_path)
+            os.remove(get_custom_container_path(container_name))
+            persisted_containers.reload_persisted_containers_from_disk()
 
     def test_containers_list(self):
         res = containers_list()
@@ -87,6 +119,41 @@ class ContainerTestCase(unittest.TestCase):
         c.remove_child('A2')
         self.assertEquals(len(c), 3)
 
+    def test_clone(self):
+        deck = Deck()
+        slot = Slot()
+        deck.add(slot, 'A1', (100, 200, 0))
+        plate = self.generate_plate(6, 3, (10, 15), (5, 15), 5)
+        plate.properties['type'] = 'plate'
+
+        clone = plate.clone()
+        slot.add(clone, 'clone')
+        clone.properties['type'] = 'clone'
+
+        self.assertEqual(plate.get_type(), 'plate')
+        self.assertEqual(len(clone), 6)
+        self.assertEqual([w.get_name() for w in clone],
+                         [w.get_name() for w in plate])
+        self.assertIsNot(clone['B2'], plate['B2'])
+        self.assertIs(clone['B2'].parent, clone)
+        self.assertIs(clone['B2']._properties, plate['B2']._properties)
+        clone['B2'].properties['radius'] = 1
+        self.assertEqual(plate['B2'].properties['radius'], 5)
+        self.assertIs(clone.rows['2']['B'], clone['B2'])
+        self.assertEqual(clone.get_index_from_name('B2'), 4)
+
+        self.assertEqual(
+            clone['B2'].coordinates(deck),
+            plate['B2'].coordinates(plate) + (100, 200, 0))
+        self.assertEqual(plate['B2'].coordinates(), (15, 30, 0))
+        self.assertEqual(
+            list(clone.wells_center(reference=deck)),
+            [w.center(deck) for w in clone])
+
+        clone.remove_child('A1')
+        self.assertEqual(len(clone), 5)
+        self.assertEqual(len(plate), 6)
+
     def test_back_container_getitem(self):
         c = self.generate_plate(4, 2, (5, 5), (0, 0), 5)
         self.assertRaises(TypeError, c.__getitem__, (1, 1))
@@ -151,6 +218,34 @@ class ContainerTestCase(unittest.TestCase):
 
         self.assertEqual(plate['A1'].coordinates(deck), (105, 215, 0))
 
+    def test_wells_bulk_geometry(self):
+        deck = Deck()
+        slot = Slot()
+        plate = self.generate_plate(
+            wells=96,
+            cols=8,
+            spacing=(10, 15),
+            offset=(5, 15),
+            radius=5
+        )
+        deck.add(slot, 'B2', (100, 200, 0))
+        slot.add(plate)
+
+        self.assertListEqual(
+            list(plate.wells_top(z=2, reference=deck)),
+            [w.top(z=2, reference=deck)[1] for w in plate])
+        self.assertListEqual(
+            list(plate.wells_bottom(radius=0.5, degrees=90, reference=deck)),
+            [w.bottom(radius=0.5, degrees=90, reference=deck)[1]
+             for w in plate])
+        self.assertListEqual(
+            list(plate.wells_center()),
+            [w.center() + w.coordinates(plate) - plate.coordinates(plate)
+             for w in plate])
+
+        plate.add(Well(properties={'radius': 1}), 'Z1', (0, 0, 0))
+        self.assertEqual(len(plate.wells_center()), 97)
+
     def test_get_name(self):
         deck = Deck()
         slot = Slot()
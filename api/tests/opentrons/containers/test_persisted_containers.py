@@ -2,6 +2,7 @@ from collections import OrderedDict
 import json
 import os
 import shutil
+import time
 import unittest
 
 from opentrons.containers import persisted_containers
@@ -74,6 +75,275 @@ class PersistedContainersTestCase(unittest.TestCase):
         self.assertEqual(well_1.coordinates(), (5.86 + 0, 8.19 + 0, 0))
         self.assertEqual(well_2.coordinates(), (5.86 + 0, 8.19 + 19.3, 0))
 
+    def test_grid_layout_is_shared(self):
+        persisted_containers.load_all_persisted_containers_from_disk()
+        plate_1 = persisted_containers.get_persisted_container("96-flat")
+        plate_2 = persisted_containers.get_persisted_container("96-flat")
+
+        self.assertIs(plate_1.get_grid_layout(), plate_2.get_grid_layout())
+        self.assertIs(plate_1.rows['2']['B'], plate_1['B2'])
+        self.assertIs(plate_2.cols['B']['2'], plate_2['B2'])
+        self.assertEqual(len(plate_2.rows), 12)
+
+    def test_containers_file_cache(self):
+        file_path = os.path.join(
+            environment.get_path('CONTAINERS_DIR'), 'cached.json')
+        cache_path = persisted_containers.get_containers_cache_path(
+            file_path)
+
+        def write(containers, mtime):
+            with open(file_path, 'w') as f:
+                json.dump({'containers': containers}, f)
+            os.utime(file_path, (mtime, mtime))
+
+        write({'cached-1': {'locations': {}}}, 1000)
+        definitions = persisted_containers.ContainerDefinitions()
+        definitions.add_file(file_path)
+        self.assertEqual(list(definitions), ['cached-1'])
+        self.assertTrue(os.path.exists(cache_path))
+
+        # Changed files are parsed again
+        write({'cached-2': {'locations': {
+            'A1': {'x': 5, 'y': 5, 'z': 0, 'diameter': 4}}}}, 2000)
+        definitions.add_file(file_path)
+        self.assertEqual(list(definitions), ['cached-1', 'cached-2'])
+
+        # Corrupted cache is rebuilt
+        with open(cache_path, 'wb') as f:
+            f.write(b'garbage')
+        definitions = persisted_containers.ContainerDefinitions()
+        definitions.add_file(file_path)
+        self.assertEqual(list(definitions), ['cached-2'])
+
+        # Definitions are read from the cache when first used
+        os.remove(file_path)
+        self.assertEqual(definitions['cached-2'], {
+            'wells': [('A1', (3, 3, 0), {
+                'diameter': 4, 'width': 4, 'length': 4, 'height': 0})],
+            'errors': []
+        })
+        self.assertNotIn('cached-1', definitions)
+        self.assertIsNone(definitions.get('cached-1'))
+
+    def test_containers_file_without_cache(self):
+        file_path = os.path.join(
+            environment.get_path('CONTAINERS_DIR'), 'uncached.json')
+        with open(file_path, 'w') as f:
+            json.dump({'containers': {
+                'uncached-1': {'locations': {}},
+                'uncached-2': {'locations': {}}
+            }}, f)
+
+        compiled = []
+        compile_containers_file = persisted_containers.compile_containers_file
+        write_containers_cache = persisted_containers.write_containers_cache
+
+        def _compile_containers_file(path):
+            compiled.append(path)
+            return compile_containers_file(path)
+
+        def _write_containers_cache(cache_path, key, containers):
+            return None, None
+
+        persisted_containers.compile_containers_file = \
+            _compile_containers_file
+        persisted_containers.write_containers_cache = _write_containers_cache
+        try:
+            definitions = persisted_containers.ContainerDefinitions()
+            definitions.add_file(file_path)
+            self.assertEqual(
+                definitions['uncached-1'], {'wells': [], 'errors': []})
+            self.assertEqual(
+                definitions['uncached-2'], {'wells': [], 'errors': []})
+        finally:
+            persisted_containers.compile_containers_file = \
+                compile_containers_file
+            persisted_containers.write_containers_cache = \
+                write_containers_cache
+            os.remove(file_path)
+
+        # Parsed once, not once per definition
+        self.assertEqual(compiled, [file_path])
+
+    def test_persisted_containers_are_cloned(self):
+        persisted_containers.load_all_persisted_containers_from_disk()
+        plate_1 = persisted_containers.get_persisted_container("96-flat")
+        plate_2 = persisted_containers.get_persisted_container("96-flat")
+
+        self.assertIsNot(plate_1, plate_2)
+        self.assertIsNot(plate_1['A1'], plate_2['A1'])
+        self.assertIs(plate_1['A1']._properties, plate_2['A1']._properties)
+        self.assertEqual(plate_1['H12'].coordinates(),
+                         plate_2['H12'].coordinates())
+
+        plate_1.properties['type'] = '96-flat'
+        self.assertNotIn('type', plate_2.properties)
+
+        # Changing a well of one clone changes neither it's siblings
+        # nor containers loaded later
+        plate_1['A1'].properties['total-liquid-volume'] = 5
+        self.assertEqual(plate_1['A1'].max_volume(), 5)
+        self.assertEqual(plate_1['B1'].max_volume(), 400)
+        self.assertEqual(plate_2['A1'].max_volume(), 400)
+        plate_3 = persisted_containers.get_persisted_container("96-flat")
+        self.assertEqual(plate_3['A1'].max_volume(), 400)
+
+        plate_4 = plate_1.clone()
+        self.assertEqual(plate_4['A1'].max_volume(), 5)
+        plate_4['A1'].properties['total-liquid-volume'] = 6
+        self.assertEqual(plate_1['A1'].max_volume(), 5)
+
+    def test_reload_changed_containers(self):
+        persisted_containers.load_all_persisted_containers_from_disk()
+        containers_dir = environment.get_path('CONTAINERS_DIR')
+        file_path = os.path.join(containers_dir, 'reloaded.json')
+
+        def write(locations, mtime):
+            with open(file_path, 'w') as f:
+                json.dump(
+                    {'containers': {'reloaded': {'locations': locations}}},
+                    f)
+            os.utime(file_path, (mtime, mtime))
+
+        self.assertEqual(
+            persisted_containers.reload_persisted_containers_from_disk(),
+            [])
+
+        write({'A1': {'x': 0, 'y': 0, 'z': 0}}, 1000)
+        self.assertEqual(
+            persisted_containers.reload_persisted_containers_from_disk(),
+            ['reloaded'])
+        self.assertIn('reloaded', persisted_containers.list_container_names())
+        self.assertEqual(
+            len(persisted_containers.get_persisted_container('reloaded')), 1)
+
+        write({
+            'A1': {'x': 0, 'y': 0, 'z': 0},
+            'A2': {'x': 0, 'y': 9, 'z': 0}
+        }, 2000)
+        self.assertEqual(
+            persisted_containers.reload_persisted_containers_from_disk(),
+            ['reloaded'])
+        self.assertEqual(
+            len(persisted_containers.get_persisted_container('reloaded')), 2)
+
+        os.remove(file_path)
+        self.assertEqual(
+            persisted_containers.reload_persisted_containers_from_disk(),
+            ['reloaded'])
+        self.assertNotIn(
+            'reloaded', persisted_containers.list_container_names())
+        self.assertIn(
+            'container-1', persisted_containers.list_container_names())
+
+    def test_reload_restores_overridden_containers(self):
+        persisted_containers.load_all_persisted_containers_from_disk()
+        file_path = os.path.join(
+            environment.get_path('CONTAINERS_DIR'), 'override.json')
+
+        def write(name, mtime):
+            with open(file_path, 'w') as f:
+                json.dump({'containers': {name: {'locations': {
+                    'A1': {'x': 0, 'y': 0, 'z': 0}}}}}, f)
+            os.utime(file_path, (mtime, mtime))
+
+        def wells():
+            return len(persisted_containers.get_persisted_container('96-flat'))
+
+        self.assertEqual(wells(), 96)
+
+        write('96-flat', 1000)
+        persisted_containers.reload_persisted_containers_from_disk()
+        self.assertEqual(wells(), 1)
+
+        # The name is dropped from the file
+        write('other', 2000)
+        persisted_containers.reload_persisted_containers_from_disk()
+        self.assertEqual(wells(), 96)
+
+        write('96-flat', 3000)
+        persisted_containers.reload_persisted_containers_from_disk()
+        self.assertEqual(wells(), 1)
+
+        os.remove(file_path)
+        persisted_containers.reload_persisted_containers_from_disk()
+        self.assertEqual(wells(), 96)
+        self.assertIn('96-flat', persisted_containers.list_container_names())
+
+    def test_containers_poller(self):
+        persisted_containers.load_all_persisted_containers_from_disk()
+        file_path = os.path.join(
+            environment.get_path('CONTAINERS_DIR'), 'polled.json')
+
+        should_stop = \
+            persisted_containers.start_persisted_containers_poller(0.01)
+        try:
+            with open(file_path, 'w') as f:
+                json.dump({'containers': {'polled': {'locations': {}}}}, f)
+            for _ in range(500):
+                if 'polled' in persisted_containers.list_container_names():
+                    break
+                time.sleep(0.01)
+            self.assertIn(
+                'polled', persisted_containers.list_container_names())
+        finally:
+            should_stop.set()
+            os.remove(file_path)
+            persisted_containers.reload_persisted_containers_from_disk()
+
+    def test_invalid_definitions(self):
+        container_data = {
+            'origin-offset': {'x': 'left'},
+            'locations': {
+                'A1': {'x': 0, 'y': 0, 'z': 0, 'diameter': 5},
+                'A2': {'x': '9', 'y': 0, 'diameter': 5},
+                'A3': [0, 0, 0],
+                'A4': {'x': 0, 'y': 18, 'z': 0, 'depth': None}
+            }
+        }
+
+        record = persisted_containers.normalize_container_definition(
+            container_data, 'plate')
+        self.assertEqual(record['wells'], [])
+        self.assertEqual(record['errors'], [
+            'plate: "origin-offset" x is not a number: \'left\'',
+            'plate: well A2 x is not a number: \'9\'',
+            'plate: well A2 has no z',
+            'plate: well A3 is not an object',
+            'plate: well A4 depth is not a number: None'
+        ])
+        self.assertRaisesRegex(
+            ValueError,
+            'well A3 is not an object',
+            persisted_containers.create_container_obj_from_dict,
+            container_data)
+
+        # All problems in all files are reported at once
+        containers_dir = environment.get_path('CONTAINERS_DIR')
+        bad_file = os.path.join(containers_dir, 'bad.json')
+        broken_file = os.path.join(containers_dir, 'broken.json')
+        with open(bad_file, 'w') as f:
+            json.dump({'containers': {
+                'bad-1': {'locations': {'A1': {'x': 0, 'y': 0}}},
+                'bad-2': {'locations': None},
+                'good': {'locations': {}}
+            }}, f)
+        with open(broken_file, 'w') as f:
+            f.write('{"containers": ')
+
+        errors = persisted_containers.validate_persisted_containers(
+            [persisted_containers.persisted_containers_json_path,
+             bad_file,
+             broken_file])
+        os.remove(bad_file)
+        os.remove(broken_file)
+
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(errors[0].endswith('"bad-1": well A1 has no z'))
+        self.assertTrue(
+            errors[1].endswith('"bad-2": "locations" is not an object'))
+        self.assertTrue(errors[2].startswith(broken_file + ': '))
+
     def test_load_all_persisted_containers(self):
         all_persisted_containers = \
             persisted_containers.load_all_persisted_containers()
@@ -123,3 +393,13 @@ class PersistedContainersTestCase(unittest.TestCase):
 
         self.assertEqual(well_1.coordinates(), (5.49 + 0, 9.69 + 0, 0))
         self.assertEqual(well_2.coordinates(), (5.49 + 0, 9.69 + 19.3, 0))
+
+        # Wells of the same shape share their properties until changed
+        self.assertIs(well_1._properties, well_2._properties)
+        self.assertRaises(
+            TypeError, well_2._properties.__setitem__, 'width', 10)
+        self.assertEqual(well_1.properties['width'], 15.62)
+        well_1.properties['width'] = 10
+        self.assertEqual(well_2.properties['width'], 15.62)
+        self.assertEqual(well_1.properties['width'], 10)
+        self.assertFalse(hasattr(well_1, '__dict__'))
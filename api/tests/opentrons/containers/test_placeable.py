@@ -3,6 +3,7 @@ import math
 
 from opentrons.containers.placeable import (
     Container,
+    LazyWellSeries,
     Well,
     Deck,
     Slot)
@@ -60,6 +61,22 @@ class PlaceableTestCase(unittest.TestCase):
 
         self.assertEqual(next(well), expected)
 
+    def test_index_after_remove_and_rename(self):
+        c = self.generate_plate(4, 2, (5, 5), (0, 0), 5)
+        b1 = c['B1']
+        c.remove_child('A1')
+        self.assertEqual(c[0], b1)
+        self.assertEqual(c.get_index_from_name('B2'), 2)
+        self.assertEqual(len(c), 3)
+        self.assertRaises(ValueError, c.get_index_from_name, 'A1')
+
+        # Name taken over by a new child, the old child keeps it's place
+        new_b1 = Well(properties={'radius': 1})
+        c.add(new_b1, 'B1', (0, 0, 0))
+        self.assertEqual(next(b1), c['A2'])
+        self.assertEqual(c[-1], new_b1)
+        self.assertEqual(c.get_index_from_name('B1'), 3)
+
     def test_cycle(self):
         c = self.generate_plate(4, 2, (5, 5), (0, 0), 5)
         cycle_iter = c.cycle()
@@ -149,6 +166,37 @@ class PlaceableTestCase(unittest.TestCase):
 
         self.assertEqual(plate['A1'].coordinates(deck), (105, 215, 0))
 
+    def test_coordinates_cache_invalidation(self):
+        deck = Deck()
+        slot = Slot()
+        plate = self.generate_plate(4, 2, (10, 10), (0, 0), 5)
+        deck.add(slot, 'A1', (100, 200, 0))
+
+        # Memoized while the plate is still the root of it's own tree
+        self.assertEqual(plate['B2'].coordinates(), (10, 10, 0))
+
+        slot.add(plate, 'plate')
+        self.assertEqual(plate['B2'].coordinates(), (110, 210, 0))
+        self.assertIs(
+            plate['B2'].coordinates(deck), plate['B2'].coordinates(deck))
+
+        slot.remove_child('plate')
+        other_slot = Slot()
+        deck.add(other_slot, 'A2', (0, 0, 0))
+        other_slot.add(plate, 'plate', (1, 2, 3))
+        self.assertEqual(plate['B2'].coordinates(deck), (11, 12, 3))
+
+    def test_add_to_leaf(self):
+        c = self.generate_plate(4, 2, (5, 5), (0, 0), 5)
+        well = c['A1']
+        self.assertFalse(well.has_children())
+        self.assertEqual(len(well), 0)
+
+        well.add(Well(properties={'radius': 1}), 'inner', (1, 1, 1))
+        self.assertEqual(len(well), 1)
+        self.assertEqual(well['inner'].coordinates(c), (1, 1, 1))
+        self.assertFalse(c['A2'].has_children())
+
     def test_get_container_name(self):
         deck = Deck()
         slot = Slot()
@@ -204,6 +252,12 @@ class PlaceableTestCase(unittest.TestCase):
         expected = (65.0, 65.0, 50.0)
         self.assertEqual(actual, expected)
 
+        # Adding to the tree drops memoized bounding boxes
+        c3 = self.generate_plate(4, 2, (5, 5), (0, 0), 5)
+        deck.add(c3, "A3", (100, 0, 0))
+        self.assertEqual(deck.max_dimensions(deck), (115.0, 65.0, 50.0))
+        self.assertEqual(c2.max_dimensions(deck), (65.0, 65.0, 50.0))
+
     def test_top_bottom(self):
         deck = Deck()
         slot = Slot()
@@ -271,6 +325,9 @@ class PlaceableTestCase(unittest.TestCase):
 
         expected = c.wells('A1', 'B1', 'C1', 'D1', 'E1', 'F1', 'G1', 'H1')
         self.assertWellSeriesEqual(c.wells('A1', to='H1'), expected)
+        self.assertEqual(str(c.wells('A1', to='H1')), str(expected))
+        self.assertTrue(
+            repr(c.wells('A1', to='H1')).startswith('<WellSeries: '))
         self.assertWellSeriesEqual(c.get('A1', to='H1'), expected)
 
         expected = c.wells('A1', 'C1', 'E1', 'G1')
@@ -287,6 +344,8 @@ class PlaceableTestCase(unittest.TestCase):
 
         expected = c.wells('A1', 'B1', 'C1', 'D1', 'E1', 'F1', 'G1', 'H1')
         self.assertWellSeriesEqual(c.wells('A1', length=8), expected)
+        self.assertEqual(
+            c.wells('A1', length=8).get_name(), expected.get_name())
 
         expected = c.wells('A1', 'C1', 'E1', 'G1', 'A2', 'C2', 'E2', 'G2')
         self.assertWellSeriesEqual(c.wells('A1', length=8, step=2), expected)
@@ -307,3 +366,29 @@ class PlaceableTestCase(unittest.TestCase):
         self.assertWellSeriesEqual(c.rows(3), c.wells(y=3))
         self.assertWellSeriesEqual(c.cols(4), c.wells(x=4))
         self.assertRaises(ValueError, c.wells, **{'x': '1', 'y': '2'})
+
+    def test_well_series_names(self):
+        c = self.generate_plate(96, 8, (5, 5), (0, 0), 5)
+
+        wells = c.wells('A1', 'C2', 'B3')
+        self.assertEqual(wells.get_name_by_instance(c['C2']), 'C2')
+        self.assertEqual(wells.get_name_by_instance(c['D4']), None)
+        self.assertEqual(wells.get_index_from_name('B3'), 2)
+
+        row = c.rows['3']
+        self.assertEqual(row.get_name_by_instance(c['B3']), 'B')
+        self.assertEqual(c.rows.get_name_by_instance(row), '3')
+
+    def test_lazy_well_series(self):
+        c = self.generate_plate(96, 8, (5, 5), (0, 0), 5)
+
+        wells = c.wells('G12', length=4)
+        self.assertIsInstance(wells, LazyWellSeries)
+        self.assertWellSeriesEqual(
+            wells, [c['G12'], c['H12'], c['A1'], c['B1']])
+        self.assertWellSeriesEqual(wells[1:3], [c['H12'], c['A1']])
+        self.assertEqual(wells['A1'], c['A1'])
+        self.assertEqual(wells.get_index_from_name('B1'), 3)
+        self.assertEqual(wells.get_name_by_instance(c['H12']), 'H12')
+        self.assertEqual(wells.coordinates(c), c['G12'].coordinates(c))
+        self.assertEqual(len(c.wells('A1', to='A1')), 0)
@@ -0,0 +1,80 @@
+import unittest
+
+from opentrons.containers.calibrator import Calibrator
+from opentrons.containers.placeable import (
+    Container,
+    Well,
+    Deck,
+    Slot)
+from opentrons.containers.well_index import WellIndex
+
+
+class WellIndexTestCase(unittest.TestCase):
+    def generate_plate(self, wells, cols, spacing, radius):
+        c = Container()
+
+        for i in range(0, wells):
+            well = Well(properties={'radius': radius})
+            row, col = divmod(i, cols)
+            name = chr(col + ord('A')) + str(1 + row)
+            coordinates = (col * spacing, row * spacing, 0)
+            c.add(well, name, coordinates)
+        return c
+
+    def generate_deck(self):
+        deck = Deck()
+        for i, name in enumerate(['A1', 'B1']):
+            slot = Slot()
+            deck.add(slot, name, (i * 100, 0, 0))
+        deck['A1'].add(self.generate_plate(16, 4, 10, 4), 'plate')
+        return deck
+
+    def test_nearest(self):
+        deck = self.generate_deck()
+        plate = deck['A1']['plate']
+        index = WellIndex(deck)
+
+        self.assertEqual(index.nearest((4, 4, 50)), plate['A1'])
+        self.assertEqual(index.nearest((25, 33, 0)), plate['C4'])
+        self.assertEqual(index.nearest((500, 500, 0)), plate['D4'])
+        self.assertEqual(
+            index.nearest((500, 500, 0), max_distance=10), None)
+
+    def test_within(self):
+        deck = self.generate_deck()
+        plate = deck['A1']['plate']
+        index = WellIndex(deck)
+
+        self.assertListEqual(
+            index.within((14, 11, 0), 8),
+            [plate['B2'], plate['B1']])
+        self.assertListEqual(index.within((70, 70, 0), 20), [])
+
+    def test_add_and_remove_container(self):
+        deck = self.generate_deck()
+        index = WellIndex(deck)
+
+        other_plate = self.generate_plate(4, 2, 10, 4)
+        deck['B1'].add(other_plate, 'other_plate')
+        index.add_container(other_plate)
+        self.assertEqual(index.nearest((105, 0, 0)), other_plate['A1'])
+        self.assertEqual(index._bounds, (0, 0, 11, 3))
+
+        index.remove_container(other_plate)
+        self.assertEqual(
+            index.nearest((105, 0, 0)), deck['A1']['plate']['D1'])
+        self.assertEqual(index._bounds, (0, 0, 3, 3))
+
+    def test_calibrated_coordinates(self):
+        deck = self.generate_deck()
+        plate = deck['A1']['plate']
+        calibrator = Calibrator(deck, {})
+        index = calibrator.well_index()
+
+        self.assertEqual(index.nearest((4, 4, 0)), plate['A1'])
+
+        # Calibrate the plate 20mm further along X
+        calibrator.calibrate({}, (plate, (0, 0, 0)), (20, 0, 0))
+        self.assertEqual(index.nearest((4, 4, 0)), plate['A1'])
+        self.assertEqual(index.nearest((24, 4, 0)), plate['A1'])
+        self.assertEqual(index.nearest((44, 4, 0)), plate['C1'])
@@ -3,9 +3,27 @@ from threading import Thread
 import unittest
 
 from opentrons import Robot, drivers
+from opentrons.drivers.smoothie_drivers.v2_0_0.player import (
+    SmoothiePlayer_2_0_0)
 from opentrons.util.vector import Vector
 
 
+def record_commands(driver, first_word=True):
+    """
+    Returns a list collecting commands :driver: sends from now on, only
+    their first words if :first_word:, otherwise all of them
+    """
+    sent = []
+    write_string = driver.connection.write_string
+
+    def _write_string(data):
+        sent.append(data.split()[0] if first_word else data.split())
+        return write_string(data)
+
+    driver.connection.write_string = _write_string
+    return sent
+
+
 class OpenTronsTest(unittest.TestCase):
 
     def setUp(self):
@@ -287,6 +305,7 @@ class OpenTronsTest(unittest.TestCase):
         setattr(self.motor.connection, 'device', old_method)
 
     def test_wait_for_arrival(self):
+        self.motor.wait_for_moves_supported = False
         self.motor.home()
         self.motor.move_head(x=200, y=200)
         self.motor.move_head(z=30)
@@ -296,6 +315,8 @@ class OpenTronsTest(unittest.TestCase):
         vs = self.motor.connection.serial_port
         for ax in vs.coordinates['target'].keys():
             vs.coordinates['target'][ax] += 10
+        # Board's target changed behind our back
+        self.motor.invalidate_target_position()
         self.assertRaises(RuntimeError, self.motor.wait_for_arrival)
         vs.coordinates = old_coords
 
@@ -375,3 +396,212 @@ class OpenTronsTest(unittest.TestCase):
         self.motor.power_off()
 
         assert True
+
+    def test_modal_state(self):
+        self.motor.home()
+
+        sent = record_commands(self.motor)
+
+        def _sent_modal():
+            res = [c for c in sent if c in self.motor.MODAL_COMMANDS]
+            sent.clear()
+            return res
+
+        self.motor.move_head(x=100)
+        self.assertEquals(_sent_modal(), ['G90', 'M203.1'])
+        self.motor.move_head(x=110)
+        self.motor.move_head(y=110)
+        self.assertEquals(_sent_modal(), [])
+
+        self.motor.move_head(x=10, mode='relative')
+        self.assertEquals(_sent_modal(), ['G91'])
+
+        self.motor.set_speed(z=1000)
+        self.assertEquals(_sent_modal(), ['M203.1'])
+        self.motor.move_head(z=-10, mode='relative')
+        self.assertEquals(_sent_modal(), [])
+
+        self.motor.set_acceleration(x=1000, y=1000)
+        self.motor.set_acceleration(x=1000)
+        self.assertEquals(_sent_modal(), ['M204'])
+
+        # Raw commands and halting make the board state unknown
+        self.motor.send_command('G90')
+        self.motor.wait_for_ok()
+        _sent_modal()
+        self.motor.move_head(x=10, mode='relative')
+        self.assertEquals(_sent_modal(), ['G91', 'M203.1'])
+
+        self.motor.send_halt_command()
+        self.motor.calm_down()
+        self.motor.move_head(x=10, mode='relative')
+        self.assertEquals(_sent_modal(), ['G91', 'M203.1'])
+
+    def test_target_position(self):
+        self.motor.home()
+
+        sent = record_commands(self.motor)
+
+        def _sent_queries():
+            res = [c for c in sent if c in ['M114.2', 'M114.4']]
+            sent.clear()
+            return res
+
+        self.motor.move_head(x=100, y=100, z=50)
+        self.assertEquals(_sent_queries().count('M114.4'), 1)
+        self.motor.move_head(x=10, mode='relative')
+        self.motor.move_plunger(a=5)
+        self.assertNotIn('M114.4', _sent_queries())
+
+        target = dict(self.motor.target_position)
+        self.assertEquals(
+            self.motor.get_head_position()['target'], (110, 100, 50))
+        self.assertEquals(self.motor.get_target_position(), target)
+
+        # Raw moves make the target unknown
+        self.motor.send_command('G0 X1')
+        self.motor.wait_for_ok()
+        self.assertEquals(self.motor.target_position, None)
+        self.motor.move_head(y=100)
+        self.assertEquals(
+            self.motor.get_head_position()['target'], (1, 100, 50))
+
+    def test_streaming(self):
+        self.motor.home()
+        self.motor.move_head(x=0, y=0, z=0)
+
+        sent = record_commands(self.motor)
+
+        self.motor.start_streaming(window=2)
+        for i in range(1, 6):
+            self.motor.move_head(x=i * 10, y=i * 5, z=10)
+            self.assertLessEqual(
+                self.motor._pending_oks, 2 * self.motor.OKS_PER_MOVE)
+        self.assertEquals(sent, ['G0'] * 5)
+
+        # Position reads wait for streamed moves
+        coords = self.motor.get_head_position()
+        self.assertEquals(coords['current'], (50, 25, 10))
+        self.assertEquals(coords['target'], (50, 25, 10))
+
+        # and so do plunger moves
+        self.motor.move_head(x=60)
+        self.motor.move_plunger(a=5)
+        self.assertEquals(self.motor._pending_oks, 0)
+        self.assertEquals(
+            self.motor.get_plunger_positions()['current']['a'], 5)
+
+        self.motor.move_head(x=70)
+        self.motor.stop_streaming()
+        self.assertFalse(self.motor.streaming)
+        self.assertEquals(
+            self.motor.get_head_position()['current'], (70, 25, 10))
+
+    def test_stop_streaming_after_error(self):
+        self.motor.home()
+        self.motor.start_streaming()
+        self.motor.move_head(x=10)
+
+        def _synchronize():
+            raise RuntimeError('Expected robot to move, please reconnect')
+
+        self.motor.synchronize = _synchronize
+        self.assertRaises(RuntimeError, self.motor.stop_streaming)
+        self.assertFalse(self.motor.streaming)
+
+    def test_wait_for_arrival_polls(self):
+        # detected on connect from the firmware version
+        self.assertTrue(self.motor.wait_for_moves_supported)
+        self.motor.wait_for_moves_supported = False
+
+        self.motor.home()
+        self.motor.move_head(x=100, y=100)
+        self.assertEquals(self.motor.arrival_polls, 1)
+
+        sent = record_commands(self.motor)
+
+        self.motor.wait_for_moves_supported = True
+        self.motor.move_head(x=200)
+        self.assertEquals(self.motor.arrival_polls, 0)
+        self.assertIn('M400', sent)
+        self.assertNotIn('M114.2', sent)
+
+        self.motor.speeds = {'x': 6000}  # 100 mm/sec
+        interval = self.motor._arrival_poll_interval
+        self.assertEquals(interval(10), 0.05)
+        self.assertEquals(interval(0.1), self.motor.ARRIVAL_POLL_MIN)
+        self.assertEquals(interval(1000), self.motor.ARRIVAL_POLL_MAX)
+
+    def test_wait_for_moves_checks_pause(self):
+        self.motor.home()
+        self.motor.move_head(x=100, y=100)
+
+        checks = []
+        check_paused_stopped = self.motor.check_paused_stopped
+
+        def _check_paused_stopped():
+            checks.append(1)
+            return check_paused_stopped()
+
+        reads = []
+        readline_from_serial = self.motor.readline_from_serial
+
+        def _readline_from_serial(timeout=3):
+            reads.append(timeout)
+            if len(reads) <= 3:
+                raise RuntimeWarning('No data')
+            return readline_from_serial(timeout=timeout)
+
+        self.motor.check_paused_stopped = _check_paused_stopped
+        self.motor.readline_from_serial = _readline_from_serial
+        self.motor.wait_for_arrival()
+
+        self.assertEquals(self.motor.arrival_polls, 0)
+        self.assertGreaterEqual(len(checks), 4)
+        self.assertTrue(
+            all(t <= self.motor.ARRIVAL_POLL_MAX for t in reads[:4]))
+
+        def _no_response(timeout=3):
+            raise RuntimeWarning('No data')
+
+        self.motor.WAIT_FOR_MOVES_TIMEOUT = 0
+        self.motor.readline_from_serial = _no_response
+        self.assertRaises(RuntimeWarning, self.motor.wait_for_arrival)
+
+    def test_record_sets_modal_state(self):
+        self.motor.home()
+        self.motor.move_head(x=100)
+
+        player = SmoothiePlayer_2_0_0()
+        self.motor.record_start(player)
+        self.motor.move_head(x=120)
+        self.motor.record_stop()
+
+        commands = [c.split()[0] for c in player.get_recorded_commands()]
+        self.assertEquals(commands[:3], ['G90', 'M203.1', 'G0'])
+
+    def test_move_after_board_moved_externally(self):
+        simulate = self.robot.smoothie_drivers['simulate']
+        self.robot.set_connection('simulate')
+        simulate.home()
+        simulate.move_head(x=100, y=300, z=40)
+
+        self.robot.set_connection('live')
+        self.motor.home()
+        self.motor.move_head(x=10, y=20, z=30)
+
+        # copies the live position onto the simulated board
+        self.robot.set_connection('simulate')
+
+        sent = record_commands(simulate, first_word=False)
+        simulate.move_head(z=60)
+
+        # X and Y are filled in from where the board is, not from where
+        # this driver last sent it (machine Y and Z are inverted)
+        moves = [c for c in sent if c[0] == 'G0']
+        self.assertEquals(len(moves), 1)
+        self.assertEquals(moves[0][1:4], ['X10.0', 'Y380.0', 'Z40'])
+        self.assertIn('G90', [c[0] for c in sent])
+
+        pos = simulate.get_head_position()['current']
+        self.assertEquals((pos['x'], pos['y'], pos['z']), (10, 20, 60))
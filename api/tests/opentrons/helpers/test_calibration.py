@@ -1,10 +1,12 @@
 import json
 import os
 import unittest
+from unittest import mock
 
 from opentrons import Robot
 from opentrons.containers import load as containers_load
-from opentrons.helpers.helpers import import_calibration_file
+from opentrons.helpers.helpers import (
+    import_calibration_file, import_calibration_json)
 from opentrons.instruments import pipette
 
 
@@ -69,3 +71,36 @@ class CalibrationTest(unittest.TestCase):
             res,
             self.robot.flip_coordinates(expected_coordinates)
         )
+
+    def test_load_json_persists_once(self):
+        json_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'pipette_calibrations.json'
+        )
+        with open(json_file_path) as f:
+            json_string = f.read()
+
+        with mock.patch.object(
+                pipette.Pipette, 'update_calibrations') as update:
+            import_calibration_json(json_string, self.robot)
+        self.assertEqual(update.call_count, 2)
+
+        pipette_calibration = json.loads(json_string)
+        for axis in 'ab':
+            calibrator = self.robot._instruments[axis.upper()].calibrator
+            for name in ['magbead', 'p200-rack', 'trash']:
+                container = self.robot._deck.containers()[name]
+                expected = pipette_calibration[axis]['theContainers'][name]
+                self.assertEqual(
+                    calibrator.convert(container, container[0].from_center(
+                        x=0, y=0, z=-1, reference=container)),
+                    self.robot.flip_coordinates(
+                        tuple(expected[c] for c in 'xyz')))
+
+    def test_load_json_unknown_container(self):
+        json_string = json.dumps({'b': {
+            'top': 0, 'bottom': 10, 'blowout': 12, 'droptip': 14,
+            'theContainers': {'missing': {'x': 1, 'y': 2, 'z': 3}}
+        }})
+        self.assertRaises(
+            ValueError, import_calibration_json, json_string, self.robot)
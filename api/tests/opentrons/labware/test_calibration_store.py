@@ -0,0 +1,125 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from opentrons.instruments.calibration_store import CalibrationStore
+from opentrons.util.vector import Vector
+
+
+class CalibrationStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.dir, 'calibrations.json')
+        self.journal_path = self.file_path + '.journal'
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def read_snapshot(self):
+        with open(self.file_path) as f:
+            return json.load(f)
+
+    def read_journal(self):
+        with open(self.journal_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_put_appends_to_journal(self):
+        store = CalibrationStore(self.file_path)
+        self.assertEqual(store.get('a:p200'), None)
+        self.assertEqual(self.read_snapshot(), {'version': 2, 'data': {}})
+
+        store.put('a:p200', {'max_volume': 200})
+        store.put('b:p10', {'max_volume': 10})
+        store.put('a:p200', {'max_volume': 300})
+
+        self.assertEqual(self.read_snapshot(), {'version': 2, 'data': {}})
+        self.assertEqual(self.read_journal(), [
+            {'version': 2, 'key': 'a:p200', 'record': {'max_volume': 200}},
+            {'version': 2, 'key': 'b:p10', 'record': {'max_volume': 10}},
+            {'version': 2, 'key': 'a:p200', 'record': {'max_volume': 300}}
+        ])
+        self.assertEqual(store.get('a:p200'), {'max_volume': 300})
+
+        # Records handed out are copies
+        store.get('a:p200')['max_volume'] = 0
+        self.assertEqual(store.get('a:p200'), {'max_volume': 300})
+
+        # Other readers fold the journal into the snapshot
+        self.assertEqual(CalibrationStore(self.file_path).get_all(), {
+            'a:p200': {'max_volume': 300},
+            'b:p10': {'max_volume': 10}
+        })
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(self.read_snapshot()['data']['b:p10'],
+                         {'max_volume': 10})
+
+        # and the first store notices the files changed
+        self.assertEqual(store.get('b:p10'), {'max_volume': 10})
+
+    def test_compaction(self):
+        store = CalibrationStore(self.file_path, max_journal_entries=2)
+        for volume in range(3):
+            store.put('a:p200', {'max_volume': volume})
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(self.read_snapshot()['data'],
+                         {'a:p200': {'max_volume': 2}})
+
+    def test_damaged_files(self):
+        with open(self.file_path, 'w') as f:
+            f.write('{"data": {}}')
+        with open(self.journal_path, 'w') as f:
+            f.write('{"key": "a:p200", "record": {"max_volume": 200}}\n')
+            f.write('{"key": "b:p10", "rec')
+
+        store = CalibrationStore(self.file_path)
+        self.assertEqual(store.get_all(), {'a:p200': {'max_volume': 200}})
+        self.assertEqual(self.read_snapshot(), {
+            'version': 2,
+            'data': {'a:p200': {'max_volume': 200}}
+        })
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_vectors(self):
+        store = CalibrationStore(self.file_path)
+        record = {
+            'name': '{"x": 1}',
+            'calibration': {'a': {'top': Vector(1, 2, 3)}}
+        }
+        store.put('a:p200', record)
+        self.assertEqual(self.read_journal()[0]['record'], {
+            'name': '{"x": 1}',
+            'calibration': {'a': {'top': {'__vector__': [1, 2, 3]}}}
+        })
+
+        store.compact()
+        self.assertEqual(
+            self.read_snapshot()['data']['a:p200']['calibration'],
+            {'a': {'top': {'__vector__': [1, 2, 3]}}})
+        # Strings which happen to be JSON stay strings
+        self.assertEqual(CalibrationStore(self.file_path).get('a:p200'),
+                         record)
+
+    def test_migrate_version_1(self):
+        vector = json.dumps({'x': 1.0, 'y': 2.0, 'z': 3.0})
+        with open(self.file_path, 'w') as f:
+            json.dump({'version': 1, 'data': {
+                'a:p200': {'calibration': {'a': {'top': vector}}}
+            }}, f)
+        with open(self.journal_path, 'w') as f:
+            f.write(json.dumps({
+                'key': 'b:p10', 'record': {'bottom': vector, 'name': 'p10'}
+            }) + '\n')
+
+        store = CalibrationStore(self.file_path)
+        self.assertEqual(store.get_all(), {
+            'a:p200': {'calibration': {'a': {'top': Vector(1, 2, 3)}}},
+            'b:p10': {'bottom': Vector(1, 2, 3), 'name': 'p10'}
+        })
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(self.read_snapshot(), {'version': 2, 'data': {
+            'a:p200': {'calibration': {'a': {
+                'top': {'__vector__': [1.0, 2.0, 3.0]}}}},
+            'b:p10': {'bottom': {'__vector__': [1.0, 2.0, 3.0]}, 'name': 'p10'}
+        }})
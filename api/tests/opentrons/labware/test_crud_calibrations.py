@@ -88,12 +88,31 @@ class CrudCalibrationsTestCase(unittest.TestCase):
                 os.path.join(calib_dir, 'calibrations.json')
             )
 
-            instrument.Instrument()._read_calibrations()
+            instrument.Instrument()._get_calibration_store().get_all()
 
             file = os.path.join(calib_dir, 'calibrations.json')
             with open(file) as f:
                 calib_object = json.load(f)
-                self.assertEquals(calib_object['version'], 1)
+                self.assertEquals(calib_object['version'], 2)
 
         test_file('data/calibrations.json')
         test_file('data/invalid_json.json')
+
+    def test_use_calibration_snapshot(self):
+        well = self.plate[0]
+        base = self.p200.calibration_snapshot()
+        base_coordinates = self.p200.calibrator.convert(well)
+
+        what_if = base.with_delta(self.plate.get_path(), Vector(1, 2, 5))
+        self.p200.use_calibration_snapshot(what_if)
+        self.assertEqual(
+            self.p200.calibrator.convert(well),
+            base_coordinates + Vector(0, 0, 2))
+
+        # Calibration saved to disk is left as it is
+        p200 = pipette.Pipette(self.robot, name="p200", axis="b")
+        self.assertEqual(
+            p200.calibration_snapshot().diff(base), {})
+
+        self.p200.use_calibration_snapshot(base)
+        self.assertEqual(self.p200.calibrator.convert(well), base_coordinates)
@@ -6,6 +6,8 @@ from opentrons.containers.placeable import Deck
 from opentrons.instruments import pipette
 from opentrons.robot.robot import Robot
 from opentrons.util.vector import Vector
+from tests.opentrons.drivers.smoothie_drivers.v2_0_0.test_motor import (
+    record_commands)
 
 
 class RobotTest(unittest.TestCase):
@@ -131,6 +133,23 @@ class RobotTest(unittest.TestCase):
         position = self.robot._driver.get_head_position()['current']
         self.assertEqual(position, (100, 0, 0))
 
+    def test_robot_move_to_streams_arc(self):
+        self.robot.move_head(x=100, y=100, z=20)
+
+        sent = record_commands(self.robot._driver)
+        self.robot.move_to((Deck(), (200, 200, 10)))
+
+        moves = [i for i, command in enumerate(sent) if command == 'G0']
+        self.assertEquals(len(moves), 3)
+        between = sent[moves[0]:moves[-1]]
+        self.assertNotIn('M400', between)
+        self.assertNotIn('M114.2', between)
+        self.assertNotIn('M114', between)
+        self.assertFalse(self.robot._driver.streaming)
+
+        position = self.robot._driver.get_head_position()['current']
+        self.assertEqual(position, (200, 200, 10))
+
     def test_move_head(self):
         self.robot.move_head(x=100, y=0, z=20)
         current = self.robot._driver.get_head_position()['current']
@@ -304,3 +323,14 @@ class RobotTest(unittest.TestCase):
         self.assertEqual(m0, self.robot.get_mosfet(0))
         m1 = self.robot.get_mosfet(1)
         self.assertEqual(m1, self.robot.get_mosfet(1))
+
+    def test_well_index(self):
+        plate = containers_load(self.robot, '96-flat', 'A1')
+        index = self.robot.well_index()
+        well = plate['C4']
+        self.assertEqual(index.nearest(well.center(self.robot._deck)), well)
+
+        tiprack = containers_load(self.robot, 'tiprack-200ul', 'B2')
+        tip = tiprack['B3']
+        self.assertIs(self.robot.well_index(), index)
+        self.assertEqual(index.nearest(tip.center(self.robot._deck)), tip)
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import unittest
+
+from opentrons.util.files import atomic_write
+
+
+class AtomicWriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.dir, 'data.json')
+
+    def tearDown(self):
+        for name in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, name))
+        os.rmdir(self.dir)
+
+    def test_atomic_write(self):
+        atomic_write(self.file_path, '{"a": 1}')
+        with open(self.file_path) as f:
+            self.assertEqual(f.read(), '{"a": 1}')
+
+        atomic_write(self.file_path, b'\x00\x01')
+        with open(self.file_path, 'rb') as f:
+            self.assertEqual(f.read(), b'\x00\x01')
+        self.assertEqual(os.listdir(self.dir), ['data.json'])
+
+    def test_failed_write_keeps_old_content(self):
+        atomic_write(self.file_path, 'old')
+        self.assertRaises(TypeError, atomic_write, self.file_path, 1)
+        with open(self.file_path) as f:
+            self.assertEqual(f.read(), 'old')
+        self.assertEqual(os.listdir(self.dir), ['data.json'])
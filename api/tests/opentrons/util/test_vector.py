@@ -1,7 +1,11 @@
 import unittest
 
-from opentrons.util.vector import (Vector, VectorEncoder, VectorValue)
+from opentrons.util.vector import (
+    Vector, VectorArray, VectorEncoder, VectorValue,
+    TaggedVectorEncoder, decode_tagged_vector)
+import copy
 import json
+import pickle
 
 
 class VectorTestCase(unittest.TestCase):
@@ -81,3 +85,39 @@ class VectorTestCase(unittest.TestCase):
         s = json.dumps(v1, cls=VectorEncoder)
         v2 = json.loads(s)
         self.assertEqual(v1, v2)
+
+    def test_tagged_json_encoder(self):
+        data = {'top': Vector(1.0, 2.0, 3.0), 'name': '{"x": 1}'}
+        s = json.dumps(data, cls=TaggedVectorEncoder)
+        self.assertEqual(json.loads(s)['top'], {'__vector__': [1, 2, 3]})
+        self.assertEqual(
+            json.loads(s, object_hook=decode_tagged_vector), data)
+
+    def test_immutable(self):
+        v1 = Vector(1, 2, 3)
+        self.assertRaises(AttributeError, setattr, v1, 'x', 5)
+        self.assertRaises(TypeError, hash, v1)
+
+        self.assertEqual(pickle.loads(pickle.dumps(v1)), v1)
+        self.assertEqual(copy.deepcopy(v1), v1)
+        self.assertEqual(v1.coordinates, VectorValue(1, 2, 3))
+
+
+class VectorArrayTestCase(unittest.TestCase):
+    def test_arithmetic(self):
+        points = VectorArray.from_vectors([(1, 2, 3), Vector(4, 5, 6)])
+        self.assertEqual(len(points), 2)
+        self.assertEqual(points[1], Vector(4, 5, 6))
+        self.assertEqual(list(points[1:]), [Vector(4, 5, 6)])
+
+        self.assertEqual(
+            list(points + (1, 1, 1)), [(2, 3, 4), (5, 6, 7)])
+        self.assertEqual(
+            list(Vector(1, 1, 1) - points), [(0, -1, -2), (-3, -4, -5)])
+        self.assertEqual(list(points - points), [(0, 0, 0), (0, 0, 0)])
+        self.assertEqual(list(points * 2), [(2, 4, 6), (8, 10, 12)])
+        self.assertEqual(
+            list(points / Vector(1, 2, 3)), [(1, 1, 1), (4, 2.5, 2)])
+
+        self.assertRaises(ValueError, points.__add__, points[:1])
+        self.assertRaises(ValueError, VectorArray, [1], [2], [])